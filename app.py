@@ -1,15 +1,107 @@
 from flask import Flask, render_template, request, jsonify
+import hashlib
+import logging
 import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from werkzeug.utils import secure_filename
+from src.resume_parser import __version__ as parser_version
 from src.resume_parser.resume_parser import ResumeParser
+from src.resume_parser.utils import text_preprocessing
+
+try:
+    # Use an Aho-Corasick automaton for the tech-skill scan when available
+    import ahocorasick
+    USING_AHOCORASICK = True
+except ImportError:
+    # Fall back to the fused regex scan if pyahocorasick is not installed
+    USING_AHOCORASICK = False
 
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'uploads'
+logger = logging.getLogger(__name__)
+# Parent directory for per-request upload temp dirs; prefer a RAM-backed
+# tmpfs where available, otherwise use the system temp directory
+app.config['UPLOAD_FOLDER'] = '/dev/shm' if os.path.isdir('/dev/shm') else None
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload
 app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'docx', 'doc', 'txt'}
+app.config['RESPONSE_CACHE_SIZE'] = 256  # Parsed responses kept for repeat uploads
+
+# Precompiled patterns used by the request handler and helpers below
+_NAME_HEADER_RE = re.compile(r'^(EDUCATION|EXPERIENCE|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY|PROFILE|OBJECTIVE)', re.IGNORECASE)
+_NAME_NONNAME_RE = re.compile(r'@|www\.|http|\.com|\.net|\.org|[0-9]{3}[-\s][0-9]{3}[-\s][0-9]{4}')
+_NAME_CAP_RE = re.compile(r'^[A-Z][a-z]+$')
+_SUMMARY_RE = re.compile(r'(?i)(SUMMARY|PROFILE|OBJECTIVE)\s*:?\s*(.*?)(?=\n\s*[A-Z]{2,}|\Z)', re.DOTALL)
+_SKILLS_SECTION_RE = re.compile(r'(?i)SKILLS\s*:?\s*(.*?)(?=\n\s*[A-Z]{2,}|\Z)', re.DOTALL)
+_SKILL_SPLIT_RE = re.compile(r'[,•|\n]')
+_COMMA_NL_RE = re.compile(r'[,\n]')
+
+# Common programming languages and technologies
+_TECH_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'PHP', 'Ruby', 'Swift', 'Kotlin', 'Go', 'Rust',
+    'HTML', 'CSS', 'SASS', 'LESS', 'Bootstrap', 'Tailwind', 
+    'React', 'Angular', 'Vue', 'Next.js', 'Svelte', 'jQuery',
+    'Node.js', 'Express', 'Django', 'Flask', 'Spring', 'Laravel', 'ASP.NET',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'SQLite', 'Redis', 'Oracle', 'SQL Server', 'Firebase',
+    'Git', 'GitHub', 'GitLab', 'BitBucket', 
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Heroku', 'Vercel', 'Netlify',
+    'Jenkins', 'GitHub Actions', 'CircleCI', 'Travis CI', 'CI/CD',
+    'REST API', 'GraphQL', 'WebSockets', 'gRPC',
+    'Agile', 'Scrum', 'Kanban', 'JIRA', 'Confluence', 'Trello',
+    'TensorFlow', 'PyTorch', 'Keras', 'Scikit-learn', 'NumPy', 'Pandas',
+    'Kubernetes', 'Terraform', 'Ansible', 'Chef', 'Puppet',
+    'Linux', 'Unix', 'Windows', 'macOS',
+    'Microservices', 'Serverless', 'Event-driven'
+]
+
+# All tech skills fused into one case-insensitive alternation. The alternation
+# sits inside a lookahead so matches don't consume text (overlapping skills are
+# still found) and is ordered longest-first so "GitHub Actions" wins over "GitHub".
+_TECH_SKILLS_RE = re.compile(
+    r'(?=\b(' + '|'.join(re.escape(s) for s in sorted(_TECH_SKILLS, key=len, reverse=True)) + r')\b)',
+    re.IGNORECASE
+)
+
+# Shorter skills implied by a longer match starting at the same position
+# (e.g. "GitHub" inside "GitHub Actions")
+_TECH_SKILLS_IMPLIED = {
+    skill.lower(): {
+        other.lower() for other in _TECH_SKILLS
+        if len(other) < len(skill) and re.match(re.escape(other) + r'\b', skill, re.IGNORECASE)
+    }
+    for skill in _TECH_SKILLS
+}
+
+_WORD_CHAR_RE = re.compile(r'\w')
+
+if USING_AHOCORASICK:
+    # Lowercased skills in one automaton, scanned in a single pass over the text
+    _TECH_SKILLS_AUTOMATON = ahocorasick.Automaton()
+    for _skill in _TECH_SKILLS:
+        _TECH_SKILLS_AUTOMATON.add_word(_skill.lower(), _skill.lower())
+    _TECH_SKILLS_AUTOMATON.make_automaton()
+
+# Shared parser instance, created on first use and reused across requests
+_parser = None
 
-# Create uploads folder if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+def get_parser():
+    """Return the shared ResumeParser, creating it on first use"""
+    global _parser
+    if _parser is None:
+        _parser = ResumeParser()
+    return _parser
+
+# LRU cache of /parse responses keyed by a hash of the parser version, file
+# extension and uploaded bytes, so re-uploading a resume skips parsing
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+def _response_cache_key(filename, data):
+    """Build the response cache key for an uploaded file"""
+    extension = os.path.splitext(filename)[1].lower()
+    return hashlib.sha256(f"{parser_version}:{extension}:".encode() + data).hexdigest()
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
@@ -33,20 +125,36 @@ def parse_resume():
     # Check if file is allowed
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        data = file.read()
+        
+        # Return the cached response if this exact file was parsed before
+        cache_key = _response_cache_key(filename, data)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+        if cached is not None:
+            return jsonify(cached)
+        
+        # Save the upload into a private temporary directory that is
+        # removed once the request has been handled
+        temp_dir = tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
+        filepath = os.path.join(temp_dir, filename)
         
         try:
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            
             # Parse the resume
-            parser = ResumeParser()
+            parser = get_parser()
             parsed_data = parser.parse(filepath)
             
-            # Debug: Print the structure of parsed_data
-            print("\nParsed data structure:", parsed_data.keys())
-            print("\nContact info:", parsed_data.get('contact_info', {}))
-            print("\nRaw text sample:", parsed_data.get('raw_text', '')[:200] + "...")
-            print("\nSkills data:", parsed_data.get('skills', {}))
-            print("\nExperience data:", parsed_data.get('experience', []))
+            # Debug: Log the structure of parsed_data
+            logger.debug("Parsed data structure: %s", parsed_data.keys())
+            logger.debug("Contact info: %s", parsed_data.get('contact_info', {}))
+            logger.debug("Raw text sample: %.200s...", parsed_data.get('raw_text', ''))
+            logger.debug("Skills data: %s", parsed_data.get('skills', {}))
+            logger.debug("Experience data: %s", parsed_data.get('experience', []))
             
             # Get raw text for further processing
             raw_text = parsed_data.get('raw_text', '')
@@ -62,29 +170,11 @@ def parse_resume():
             
             # If contact info is missing, try direct extraction from raw text
             if not emails and not phones and not urls:
-                # Extract using regex
-                import re
-                # Email extraction
-                email_matches = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', raw_text)
-                emails.extend([email for email in email_matches if email not in emails])
-                
-                # Phone extraction
-                phone_matches = re.findall(r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', raw_text)
-                for phone_match in phone_matches:
-                    full_phone = ''.join(phone_match).strip()
-                    if full_phone and full_phone not in phones:
-                        phones.append(full_phone)
-                
-                # URL extraction
-                url_matches = re.findall(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+', raw_text)
-                urls.extend([url for url in url_matches if url not in urls])
-                
-                # LinkedIn URL extraction
-                linkedin_matches = re.findall(r'linkedin\.com/\w+/[\w-]+', raw_text)
-                for match in linkedin_matches:
-                    linkedin_url = f"https://{match}" if not match.startswith('http') else match
-                    if linkedin_url not in urls:
-                        urls.append(linkedin_url)
+                logger.warning("Parser found no contact info, scanning raw text instead")
+                contacts = text_preprocessing.extract_contact_info(raw_text)
+                emails = contacts['emails']
+                phones = contacts['phones']
+                urls = contacts['urls']
             
             # Extract skills from both skills data and raw text
             skills_data = parsed_data.get('skills', {})
@@ -120,25 +210,27 @@ def parse_resume():
                 'certifications': transform_certifications(parsed_data.get('certifications', []))
             }
             
-            # Clean up the file
-            os.remove(filepath)
+            # Debug: Log the transformed data
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Transformed data:")
+                logger.debug("Name: %s", transformed_data['name'])
+                logger.debug("Contact: %s, %s", transformed_data['email'], transformed_data['phone'])
+                logger.debug("Skills: %s", transformed_data['skills'])
+                logger.debug("Experience: %s", [{k:v for k,v in exp.items() if v} for exp in transformed_data['experience']])
             
-            # Debug: Print the transformed data
-            print("\nTransformed data:")
-            print(f"Name: {transformed_data['name']}")
-            print(f"Contact: {transformed_data['email']}, {transformed_data['phone']}")
-            print(f"Skills: {transformed_data['skills']}")
-            print(f"Experience: {[{k:v for k,v in exp.items() if v} for exp in transformed_data['experience']]}")
+            # Cache the response, evicting the least recently used entry
+            with _response_cache_lock:
+                _response_cache[cache_key] = transformed_data
+                if len(_response_cache) > app.config['RESPONSE_CACHE_SIZE']:
+                    _response_cache.popitem(last=False)
             
             return jsonify(transformed_data)
         except Exception as e:
-            # Clean up the file
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            print(f"\nException during parsing: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception during parsing: %s", e)
             return jsonify({'error': str(e)}), 500
+        finally:
+            # Clean up the uploaded file
+            shutil.rmtree(temp_dir, ignore_errors=True)
     else:
         return jsonify({'error': 'File type not allowed'}), 400
 
@@ -147,50 +239,41 @@ def extract_name(text):
     if not text:
         return None
     
-    lines = text.strip().split('\n')
-    if not lines:
-        return None
+    # Only the top of the resume is inspected, so stop splitting after 5 lines
+    lines = text.strip().split('\n', 5)
         
     # Try common name patterns at the top of resume
-    import re
-    
     # Look for a typical name pattern in the first 5 lines
-    for i in range(min(5, len(lines))):
-        line = lines[i].strip()
+    for line in lines[:5]:
+        line = line.strip()
         
         # Skip empty lines and lines that are too long or too short
         if not line or len(line) > 50 or len(line) < 3:
             continue
             
         # Skip lines that look like headers, titles or contact info
-        if re.search(r'^(EDUCATION|EXPERIENCE|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY|PROFILE|OBJECTIVE)', 
-                    line, re.IGNORECASE):
+        if _NAME_HEADER_RE.search(line):
             continue
             
         # Skip lines that contain typical non-name content
-        if re.search(r'@|www\.|http|\.com|\.net|\.org|[0-9]{3}[-\s][0-9]{3}[-\s][0-9]{4}', line):
+        if _NAME_NONNAME_RE.search(line):
             continue
             
         # If line contains 1-4 words, it might be a name
         words = line.split()
         if 1 <= len(words) <= 4:
             # Check if any word looks like a typical name (capital first letter, rest lowercase)
-            if any(re.match(r'^[A-Z][a-z]+$', word) for word in words):
+            if any(_NAME_CAP_RE.match(word) for word in words):
                 return line
     
-    # If no name found with the above logic, try using the first non-empty line
-    for line in lines:
-        if line.strip():
-            return line.strip()
-            
-    return None
+    # If no name found with the above logic, use the first non-empty line,
+    # which is always the first line once the text has been stripped
+    return lines[0].strip() or None
 
 def extract_summary(text):
     """Extract summary section from resume"""
     # Look for summary/objective sections
-    import re
-    summary_match = re.search(r'(?i)(SUMMARY|PROFILE|OBJECTIVE)\s*:?\s*(.*?)(?=\n\s*[A-Z]{2,}|\Z)', 
-                             text, re.DOTALL)
+    summary_match = _SUMMARY_RE.search(text)
     if summary_match:
         return summary_match.group(2).strip()
     return None
@@ -215,53 +298,38 @@ def transform_education(education_list):
         result.append(entry)
     return result
 
+# Alternative key names used for experience fields, in order of preference
+_TITLE_KEYS = ('job_title', 'title', 'position')
+_COMPANY_KEYS = ('company', 'employer', 'organization')
+_DATE_KEYS = ('date_range', 'date', 'duration')
+
+def _join_bullets(value):
+    """Render a list of items as bullet lines; strings are returned unchanged"""
+    if isinstance(value, list):
+        return '• ' + '\n• '.join(value) if value else ''
+    if isinstance(value, str):
+        return value
+    return None
+
 def transform_experience(experience_list):
     """Transform experience data to front-end format"""
-    print(f"\nExperience list type: {type(experience_list)}")
-    print(f"Experience list content: {experience_list}")
+    logger.debug("Experience list type: %s", type(experience_list))
+    logger.debug("Experience list content: %s", experience_list)
     
     result = []
     for exp in experience_list:
-        print(f"Experience entry: {exp}")
-        # Handle different possible key names for job title
-        job_title = None
-        if 'job_title' in exp:
-            job_title = exp['job_title']
-        elif 'title' in exp:
-            job_title = exp['title']
-        elif 'position' in exp:
-            job_title = exp['position']
-        
-        # Handle different possible key names for company
-        company = None
-        if 'company' in exp:
-            company = exp['company']
-        elif 'employer' in exp:
-            company = exp['employer']
-        elif 'organization' in exp:
-            company = exp['organization']
-        
-        # Handle different possible key names for date
-        date = None
-        if 'date_range' in exp:
-            date = exp['date_range']
-        elif 'date' in exp:
-            date = exp['date']
-        elif 'duration' in exp:
-            date = exp['duration']
+        logger.debug("Experience entry: %s", exp)
+        # Handle different possible key names for job title, company and date
+        job_title = next((exp[key] for key in _TITLE_KEYS if key in exp), None)
+        company = next((exp[key] for key in _COMPANY_KEYS if key in exp), None)
+        date = next((exp[key] for key in _DATE_KEYS if key in exp), None)
         
         # Join responsibilities into a description
         description = None
-        if 'responsibilities' in exp and exp['responsibilities']:
-            if isinstance(exp['responsibilities'], list):
-                description = '\n'.join(['• ' + item for item in exp['responsibilities']])
-            elif isinstance(exp['responsibilities'], str):
-                description = exp['responsibilities']
+        if exp.get('responsibilities'):
+            description = _join_bullets(exp['responsibilities'])
         elif 'description' in exp:
-            if isinstance(exp['description'], list):
-                description = '\n'.join(['• ' + item for item in exp['description']])
-            elif isinstance(exp['description'], str):
-                description = exp['description']
+            description = _join_bullets(exp['description'])
         
         # If we have at least a company or job title, add the entry
         if job_title or company:
@@ -277,16 +345,15 @@ def transform_experience(experience_list):
 
 def extract_skills(skills_data):
     """Extract skills in a flat list"""
-    # For debugging, return the skills data structure
-    print(f"\nSkills data type: {type(skills_data)}")
-    import re
+    # For debugging, log the skills data structure
+    logger.debug("Skills data type: %s", type(skills_data))
     
     # If skills is a pure string, try to extract skills from it
     if isinstance(skills_data, str):
         if not skills_data.strip():
             return []
         # Split by commas or newlines
-        skills = re.split(r'[,\n]', skills_data)
+        skills = _COMMA_NL_RE.split(skills_data)
         return [skill.strip() for skill in skills if skill.strip()]
     
     # If skills has 'all' field as a list, use it
@@ -295,7 +362,7 @@ def extract_skills(skills_data):
     
     # If skills has 'all' field but it's a string, split it
     if isinstance(skills_data, dict) and 'all' in skills_data and isinstance(skills_data['all'], str) and skills_data['all']:
-        skills = re.split(r'[,\n]', skills_data['all'])
+        skills = _COMMA_NL_RE.split(skills_data['all'])
         return [skill.strip() for skill in skills if skill.strip()]
     
     # If skills has technical categories, flatten them
@@ -306,7 +373,7 @@ def extract_skills(skills_data):
             if isinstance(category, list):
                 all_skills.extend(category)
             elif isinstance(category, str):
-                skills = re.split(r'[,\n]', category)
+                skills = _COMMA_NL_RE.split(category)
                 all_skills.extend([skill.strip() for skill in skills if skill.strip()])
     
     # Add any soft skills
@@ -314,7 +381,7 @@ def extract_skills(skills_data):
     if isinstance(soft_skills, list):
         all_skills.extend(soft_skills)
     elif isinstance(soft_skills, str) and soft_skills.strip():
-        skills = re.split(r'[,\n]', soft_skills)
+        skills = _COMMA_NL_RE.split(soft_skills)
         all_skills.extend([skill.strip() for skill in skills if skill.strip()])
     
     # Add tools if present
@@ -322,7 +389,7 @@ def extract_skills(skills_data):
     if isinstance(tools, list):
         all_skills.extend(tools)
     elif isinstance(tools, str) and tools.strip():
-        skills = re.split(r'[,\n]', tools)
+        skills = _COMMA_NL_RE.split(tools)
         all_skills.extend([skill.strip() for skill in skills if skill.strip()])
     
     # If we couldn't find any skills using the above methods, try direct extraction from raw text
@@ -331,51 +398,56 @@ def extract_skills(skills_data):
         all_skills.extend(extracted_skills)
     
     # Deduplicate and sort
-    unique_skills = list(set([skill for skill in all_skills if skill]))
-    return sorted(unique_skills)
+    return sorted({skill for skill in all_skills if skill})
+
+def _is_word_boundary(text, pos):
+    """Check if position pos in text is a word boundary (like regex \\b)"""
+    before = pos > 0 and _WORD_CHAR_RE.match(text, pos - 1) is not None
+    after = pos < len(text) and _WORD_CHAR_RE.match(text, pos) is not None
+    return before != after
+
+def _find_tech_skills(text):
+    """Find the lowercased tech skills that occur as whole words in text"""
+    found = set()
+    text_lc = text.lower()
+    
+    # Offsets only line up if lowercasing kept the text length
+    if USING_AHOCORASICK and len(text_lc) == len(text):
+        for end, skill in _TECH_SKILLS_AUTOMATON.iter(text_lc):
+            start = end - len(skill) + 1
+            if _is_word_boundary(text, start) and _is_word_boundary(text, end + 1):
+                found.add(skill)
+        return found
+    
+    for match in _TECH_SKILLS_RE.finditer(text):
+        matched = match.group(1).lower()
+        found.add(matched)
+        found.update(_TECH_SKILLS_IMPLIED[matched])
+    return found
 
 def extract_skills_from_raw_text(text):
     """Extract skills directly from raw text"""
     if not text:
         return []
         
-    import re
     skills = []
     
-    # Common programming languages and technologies
-    common_tech_skills = [
-        'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'PHP', 'Ruby', 'Swift', 'Kotlin', 'Go', 'Rust',
-        'HTML', 'CSS', 'SASS', 'LESS', 'Bootstrap', 'Tailwind', 
-        'React', 'Angular', 'Vue', 'Next.js', 'Svelte', 'jQuery',
-        'Node.js', 'Express', 'Django', 'Flask', 'Spring', 'Laravel', 'ASP.NET',
-        'PostgreSQL', 'MySQL', 'MongoDB', 'SQLite', 'Redis', 'Oracle', 'SQL Server', 'Firebase',
-        'Git', 'GitHub', 'GitLab', 'BitBucket', 
-        'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Heroku', 'Vercel', 'Netlify',
-        'Jenkins', 'GitHub Actions', 'CircleCI', 'Travis CI', 'CI/CD',
-        'REST API', 'GraphQL', 'WebSockets', 'gRPC',
-        'Agile', 'Scrum', 'Kanban', 'JIRA', 'Confluence', 'Trello',
-        'TensorFlow', 'PyTorch', 'Keras', 'Scikit-learn', 'NumPy', 'Pandas',
-        'Kubernetes', 'Terraform', 'Ansible', 'Chef', 'Puppet',
-        'Linux', 'Unix', 'Windows', 'macOS',
-        'Microservices', 'Serverless', 'Event-driven'
-    ]
-    
     # Try to find skills section
-    skills_section = re.search(r'(?i)SKILLS\s*:?\s*(.*?)(?=\n\s*[A-Z]{2,}|\Z)', text, re.DOTALL)
+    skills_section = _SKILLS_SECTION_RE.search(text)
     if skills_section:
         skills_text = skills_section.group(1).strip()
         # Split by common delimiters
-        skill_items = re.split(r'[,•|\n]', skills_text)
+        skill_items = _SKILL_SPLIT_RE.split(skills_text)
         for item in skill_items:
             item = item.strip()
             if item and len(item) < 30:  # Reasonable length for a skill
                 skills.append(item)
     
-    # Also look for common tech skills throughout the text
-    for skill in common_tech_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-            # Use the proper casing from our list
-            skills.append(skill)
+    # Also look for common tech skills throughout the text in a single scan
+    found = _find_tech_skills(text)
+    
+    # Use the proper casing from our list
+    skills.extend(skill for skill in _TECH_SKILLS if skill.lower() in found)
     
     return skills
 
@@ -412,4 +484,5 @@ def transform_certifications(certifications_list):
     return result
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
     app.run(debug=True) 
\ No newline at end of file
@@ -19,7 +19,7 @@ def parse_args():
     
     parser.add_argument(
         "file",
-        help="Path to the resume file (PDF, DOCX, TXT, JPG, JPEG, PNG)"
+        help="Path to the resume file (PDF, DOCX, TXT, JPG, JPEG, PNG), or a directory of them"
     )
     
     parser.add_argument(
@@ -43,6 +43,14 @@ def parse_args():
         action="store_true"
     )
     
+    parser.add_argument(
+        "--workers",
+        "-w",
+        help="Number of worker processes for a directory's files (default: CPU count) "
+             "or a long PDF's pages (default: none)",
+        type=int
+    )
+    
     parser.add_argument(
         "--tesseract-cmd",
         help="Path to the Tesseract executable (for OCR)",
@@ -52,6 +60,14 @@ def parse_args():
     return parser.parse_args()
 
 
+def _extract_metadata_or_error(parser: ResumeParser, file_path: str) -> Dict:
+    """Extract a file's metadata, or {"error": message} if that fails."""
+    try:
+        return parser.extract_metadata(file_path)
+    except Exception as e:
+        return {"error": str(e)}
+
+
 def main():
     """Main entry point for the CLI."""
     args = parse_args()
@@ -60,11 +76,19 @@ def main():
         # Initialize resume parser
         parser = ResumeParser(tesseract_cmd=args.tesseract_cmd)
         
-        # Parse resume or extract metadata
-        if args.metadata_only:
+        # Parse resume or extract metadata; a directory maps each file to its
+        # result, or to an error for a file that fails, keeping the others
+        if os.path.isdir(args.file) and args.metadata_only:
+            result = {
+                file_path: _extract_metadata_or_error(parser, file_path)
+                for file_path in parser.list_resume_files(args.file)
+            }
+        elif os.path.isdir(args.file):
+            result = parser.parse_directory(args.file, workers=args.workers)
+        elif args.metadata_only:
             result = parser.extract_metadata(args.file)
         else:
-            result = parser.parse(args.file)
+            result = parser.parse(args.file, workers=args.workers)
         
         # Determine output format
         json_kwargs = {"indent": 4} if args.pretty else {}
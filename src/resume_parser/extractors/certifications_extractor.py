@@ -3,40 +3,145 @@ Certifications extraction module for extracting certification details from resum
 """
 
 import re
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from resume_parser.utils import text_preprocessing
 
+try:
+    # RE2 matches in linear time, without backtracking on long inputs
+    import re2
+    USING_RE2 = True
+except ImportError:
+    # Fall back to the standard library engine if google-re2 is not installed
+    USING_RE2 = False
+
+# Aho-Corasick finds every issuer keyword in a single pass over the text;
+# without pyahocorasick the issuer regex is used instead
+USING_AHOCORASICK = text_preprocessing.USING_AHOCORASICK
+
+try:
+    # Hyperscan checks every date and ID pattern in one native pass
+    import hyperscan
+    USING_HYPERSCAN = True
+except ImportError:
+    # Without Hyperscan the date and ID regexes always run
+    USING_HYPERSCAN = False
+
+# Below this length the RE2 binding's per-call overhead outweighs its faster scan
+_RE2_MIN_LENGTH = 256
+
+
+def _build_pattern_database(families: List[List[str]]) -> "hyperscan.Database":
+    """
+    Compile pattern families into one Hyperscan database used as a prefilter.
+
+    Every pattern is reported under the index of its family. Hyperscan has no
+    capture groups, so it only tells which families can match; the regexes
+    still extract the values. All patterns are compiled caseless, which can
+    only add hits, never lose them.
+
+    Args:
+        families: Lists of patterns, one list per family.
+
+    Returns:
+        Compiled block-mode database.
+    """
+    expressions = []
+    ids = []
+    for family, patterns in enumerate(families):
+        for pattern in patterns:
+            if pattern.startswith("(?i)"):
+                pattern = pattern[4:]
+            expressions.append(pattern.encode("ascii"))
+            ids.append(family)
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=ids,
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+    )
+    return database
+
+
+def _record_family(family: int, start: int, end: int, flags: int, found: set) -> None:
+    """Hyperscan match handler collecting the families that matched."""
+    found.add(family)
+
 
 class CertificationsExtractor:
     """
     Extract certification details from resume text.
     """
 
+    # All state is class-level, so instances need no attribute dict
+    __slots__ = ()
+
     # Common certification issuers
+    ISSUER_KEYWORDS = [
+        "Microsoft", "AWS", "Amazon", "Google", "Oracle", "IBM", "Cisco", "CompTIA", "PMI",
+        "Salesforce", "Adobe", "Axelos", "SAP", "HubSpot", "Coursera", "Udemy", "edX",
+        "LinkedIn Learning", "Pluralsight", "FreeCodeCamp", "DataCamp", "Kaggle",
+        "Scrum Alliance", "ISC2", "EC-Council", "ISACA", "Certified", "University",
+        "Institute", "Academy", "College", "GeeksforGeeks"
+    ]
+
     ISSUER_PATTERNS = [
-        r"(?i)(?:^|\s)(Microsoft|AWS|Amazon|Google|Oracle|IBM|Cisco|CompTIA|PMI|Salesforce|Adobe|Axelos|SAP|HubSpot|Coursera|Udemy|edX|LinkedIn Learning|Pluralsight|FreeCodeCamp|DataCamp|Kaggle|Scrum Alliance|ISC2|EC-Council|ISACA|Certified|University|Institute|Academy|College|GeeksforGeeks)(?:\s|$|,|\.)"
+        r"(?i)(?:^|\s)(" + "|".join(map(re.escape, ISSUER_KEYWORDS)) + r")(?:\s|$|,|\.)"
     ]
 
     # Date patterns
     DATE_PATTERNS = [
-        r"(?i)(?:^|\s)(\d{4})(?:\s|$|,|\.)",
+        r"(?:^|\s)(\d{4})(?:\s|$|,|\.)",
         r"(?i)(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}(?:\s|$|,|\.)",
         r"(?i)(?:^|\s)(January|February|March|April|May|June|July|August|September|October|November|December),? \d{4}(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4})(?:\s|$|,|\.)"
+        r"(?:^|\s)(\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4})(?:\s|$|,|\.)"
     ]
 
     # Certification ID/credential patterns
     ID_PATTERNS = [
-        r"(?i)(?:^|\s)(ID|No|Number|Credential ID|Certificate ID|Certification Number|#)[:\s]+([A-Za-z0-9\-]+)(?:\s|$|,|\.)",
         r"(?i)(?:^|\s)(ID|No|Number|Credential ID|Certificate ID|Certification Number|#)[:\s]+([A-Za-z0-9\-]+)(?:\s|$|,|\.)"
     ]
 
-    def __init__(self):
-        """Initialize the certifications extractor."""
-        self.issuer_patterns = [re.compile(pattern) for pattern in self.ISSUER_PATTERNS]
-        self.date_patterns = [re.compile(pattern) for pattern in self.DATE_PATTERNS]
-        self.id_patterns = [re.compile(pattern) for pattern in self.ID_PATTERNS]
+    # Patterns are compiled once, when the class is defined
+    _ISSUER_RE = text_preprocessing.combine_patterns(ISSUER_PATTERNS)
+    _DATE_RE = text_preprocessing.combine_patterns(DATE_PATTERNS)
+    _ID_RE = text_preprocessing.combine_patterns(ID_PATTERNS)
+
+    # Joins entries for bulk cleaning; not whitespace, so clean_text keeps it
+    _ENTRY_SEPARATOR = "\x00"
+
+    # Blank lines between certification entries
+    _BLANK_LINE_RE = re.compile(r'\n\s*\n')
+
+    # Separators between a certification name and the rest of the entry
+    _SEPARATOR_RE = re.compile(r'[,|–-]')
+
+    # Every date pattern needs a digit, so entries without one skip the date regex
+    _DIGIT_RE = re.compile(r'\d')
+
+    # Characters ending an issuer name
+    _ISSUER_END_RE = re.compile(r'[,.\n]')
+
+    # Certification names handled by the special-case handlers
+    _MONGODB_NAME_RE = re.compile(r"MongoDB\s+Developers\s+Tool\s+Kit")
+    _AWS_NAME_RE = re.compile(r"AWS Certified Developer\s*-\s*Associate")
+
+    if USING_RE2:
+        _ISSUER_RE2 = re2.compile(_ISSUER_RE.pattern)
+        _DATE_RE2 = re2.compile(_DATE_RE.pattern)
+        _ID_RE2 = re2.compile(_ID_RE.pattern)
+
+    if USING_HYPERSCAN:
+        # Family 0 is the dates, family 1 the credential IDs. Scratch space
+        # can't be shared between concurrent scans, so each thread gets its own.
+        _PATTERN_DATABASE = _build_pattern_database([DATE_PATTERNS, ID_PATTERNS])
+        _SCRATCH = threading.local()
+
+    if USING_AHOCORASICK:
+        _ISSUER_AUTOMATON = text_preprocessing.build_keyword_automaton(ISSUER_KEYWORDS)
 
     def extract_certifications(self, text: str) -> List[Dict]:
         """
@@ -61,18 +166,27 @@ class CertificationsExtractor:
         # Split the text into potential certification entries
         entries = self._split_certification_entries(text)
         
-        for entry in entries:
-            # Clean the entry text
-            clean_entry = text_preprocessing.clean_text(entry)
-            
+        # Clean all entries in one pass. They are already stripped, so joined
+        # by a separator that isn't whitespace they clean exactly as they
+        # would one by one.
+        if self._ENTRY_SEPARATOR not in text:
+            cleaned = text_preprocessing.clean_text(self._ENTRY_SEPARATOR.join(entries))
+            clean_entries = cleaned.split(self._ENTRY_SEPARATOR)
+        else:
+            clean_entries = [text_preprocessing.clean_text(entry) for entry in entries]
+        
+        for clean_entry in clean_entries:
             if not clean_entry:
                 continue
                 
-            # Extract details from the entry
-            name = self._extract_certification_name(clean_entry)
-            issuer = self._extract_issuer(clean_entry)
-            date = self._extract_date(clean_entry)
-            credential_id = self._extract_credential_id(clean_entry)
+            # Extract details from the entry; the name and the fallback
+            # issuer both come from the same separator split
+            segments = self._split_name_segments(clean_entry)
+            name = segments[0].strip()
+            issuer = self._extract_issuer(clean_entry, segments)
+            has_date, has_credential_id = self._prefilter_details(clean_entry)
+            date = self._extract_date(clean_entry) if has_date else None
+            credential_id = self._extract_credential_id(clean_entry) if has_credential_id else None
             
             # Only add entries that have at least a name
             if name:
@@ -88,6 +202,51 @@ class CertificationsExtractor:
                 
         return certification_entries
         
+    @staticmethod
+    def _use_re2(text: str) -> bool:
+        """
+        Check whether a certification entry should be matched with RE2.
+
+        RE2 character classes are ASCII-only, so it is only used for ASCII text.
+        Entries have been through clean_text, which leaves a plain space as the
+        only whitespace, so RE2's narrower whitespace class makes no difference here.
+
+        Args:
+            text: Certification entry text.
+
+        Returns:
+            True if RE2 should be used.
+        """
+        return USING_RE2 and len(text) >= _RE2_MIN_LENGTH and text.isascii()
+
+    def _prefilter_details(self, text: str) -> Tuple[bool, bool]:
+        """
+        Check whether the date and credential ID patterns can match an entry.
+
+        With Hyperscan, all of them are checked in a single pass, so an entry
+        without a date or ID skips that regex. This is only done for ASCII
+        text, where Hyperscan's character classes agree with the re module's.
+        Otherwise only entries without any digit are known to have no date.
+
+        Args:
+            text: Certification entry text.
+
+        Returns:
+            Tuple of whether a date and whether a credential ID may be present.
+        """
+        if not (USING_HYPERSCAN and text.isascii()):
+            return self._DIGIT_RE.search(text) is not None, True
+
+        scratch = getattr(self._SCRATCH, "scratch", None)
+        if scratch is None:
+            scratch = self._SCRATCH.scratch = hyperscan.Scratch(self._PATTERN_DATABASE)
+
+        found = set()
+        self._PATTERN_DATABASE.scan(
+            text.encode("ascii"), match_event_handler=_record_family, context=found, scratch=scratch
+        )
+        return 0 in found, 1 in found
+
     def _split_certification_entries(self, text: str) -> List[str]:
         """
         Split certifications text into separate entries.
@@ -99,75 +258,105 @@ class CertificationsExtractor:
             List of certification entry texts.
         """
         # Try to split by double line breaks first
-        entries = re.split(r'\n\s*\n', text)
+        entries = self._BLANK_LINE_RE.split(text)
         
         # If that didn't work well, try single line breaks
         if len(entries) <= 1:
-            entries = re.split(r'\n', text)
+            entries = text.split('\n')
             
-        # Filter out empty entries
-        return [entry.strip() for entry in entries if entry.strip()]
+        # Filter out empty entries, stripping each one only once
+        return [stripped for entry in entries if (stripped := entry.strip())]
         
-    def _extract_certification_name(self, text: str) -> Optional[str]:
+    def _split_name_segments(self, text: str) -> List[str]:
         """
-        Extract certification name from text.
+        Split certification entry text at its first comma, pipe or dash.
         
         Args:
             text: Certification entry text.
             
         Returns:
-            Extracted certification name or None.
+            The certification name segment, followed by the rest of the text
+            if a separator was found.
         """
         # Certification name is typically the first line or before the first comma/dash
-        segments = re.split(r'[,|–-]', text, 1)
+        return self._SEPARATOR_RE.split(text, 1)
         
-        if segments:
-            # Return the first segment as the name
-            return segments[0].strip()
-            
-        return None
-        
-    def _extract_issuer(self, text: str) -> Optional[str]:
+    def _extract_issuer(self, text: str, segments: List[str]) -> Optional[str]:
         """
         Extract certification issuer from text.
         
         Args:
             text: Certification entry text.
+            segments: Entry text split by _split_name_segments.
             
         Returns:
             Extracted issuer or None.
         """
         # Check for common issuer names
-        for pattern in self.issuer_patterns:
-            match = pattern.search(text)
-            if match:
-                # Try to get the full issuer name
-                issuer_start = match.start()
-                
-                # Look for the end of the issuer (next comma, period, or line break)
-                end_markers = [',', '.', '\n']
-                issuer_end = len(text)
-                
-                for marker in end_markers:
-                    marker_pos = text.find(marker, issuer_start)
-                    if marker_pos > -1 and marker_pos < issuer_end:
-                        issuer_end = marker_pos
-                
-                # Extract the full issuer name
-                issuer_text = text[issuer_start:issuer_end].strip()
-                
-                # If the extracted text is too long, just return the matched keyword
-                if len(issuer_text.split()) > 5:
-                    return match.group(1)
-                else:
-                    return issuer_text
+        keyword_match = self._find_issuer_keyword(text)
+        if keyword_match:
+            # Try to get the full issuer name
+            issuer_start, keyword = keyword_match
+            
+            # Look for the end of the issuer (next comma, period, or line break)
+            end_match = self._ISSUER_END_RE.search(text, issuer_start)
+            issuer_end = end_match.start() if end_match else len(text)
+            
+            # Extract the full issuer name
+            issuer_text = text[issuer_start:issuer_end].strip()
+            
+            # If the extracted text is too long, just return the matched keyword
+            if len(issuer_text.split()) > 5:
+                return keyword
+            else:
+                return issuer_text
         
         # Look for issuer in the second segment (after a comma or dash)
-        segments = re.split(r'[,|–-]', text, 1)
         if len(segments) > 1:
             return segments[1].strip()
             
         return None
+
+    def _find_issuer_keyword(self, text: str) -> Optional[Tuple[int, str]]:
+        """
+        Find the first issuer keyword in text, as ISSUER_PATTERNS would.
+
+        ASCII text is scanned with the Aho-Corasick automaton. A keyword only
+        counts if it is preceded by whitespace or the start of the text and
+        followed by whitespace, a comma, a period or the end of the text.
+        Among the valid hits, the leftmost wins, and ties go to the keyword
+        listed first.
+
+        Args:
+            text: Certification entry text.
+
+        Returns:
+            Tuple of the match start (including the leading whitespace) and the
+            keyword as written in the text, or None.
+        """
+        if not (USING_AHOCORASICK and text.isascii()):
+            pattern = self._ISSUER_RE2 if self._use_re2(text) else self._ISSUER_RE
+            match = pattern.match(text)
+            if match:
+                return match.start(match.lastindex), match.group(match.lastindex + 1)
+            return None
+
+        best = None
+        for end, (index, length) in self._ISSUER_AUTOMATON.iter(text.lower()):
+            start = end - length + 1
+            if start > 0 and not text[start - 1].isspace():
+                continue
+            following = text[end + 1:end + 2]
+            if following and not following.isspace() and following not in ',.':
+                continue
+            if best is None or (start, index) < best[:2]:
+                best = (start, index, length)
+
+        if best is None:
+            return None
+
+        start, _, length = best
+        return max(start - 1, 0), text[start:start + length]
         
     def _extract_date(self, text: str) -> Optional[str]:
         """
@@ -179,10 +368,10 @@ class CertificationsExtractor:
         Returns:
             Extracted date or None.
         """
-        for pattern in self.date_patterns:
-            match = pattern.search(text)
-            if match:
-                return match.group(0).strip()
+        pattern = self._DATE_RE2 if self._use_re2(text) else self._DATE_RE
+        match = pattern.match(text)
+        if match:
+            return match.group(match.lastgroup).strip()
                 
         return None
         
@@ -196,10 +385,10 @@ class CertificationsExtractor:
         Returns:
             Extracted credential ID or None.
         """
-        for pattern in self.id_patterns:
-            match = pattern.search(text)
-            if match and len(match.groups()) > 1:
-                return match.group(2).strip()
+        pattern = self._ID_RE2 if self._use_re2(text) else self._ID_RE
+        match = pattern.match(text)
+        if match:
+            return match.group(match.lastindex + 2).strip()
                 
         return None
 
@@ -214,16 +403,12 @@ class CertificationsExtractor:
             List with the properly formatted certification entry.
         """
         # Extract the MongoDB certification entry
-        name_match = re.search(r"MongoDB\s+Developers\s+Tool\s+Kit", text)
-        issuer_match = re.search(r"GeeksforGeeks", text)
-        date_match = re.search(r"2024", text)
-        
-        if name_match:
+        if self._MONGODB_NAME_RE.search(text):
             # Create a proper certification entry
             return [{
                 "name": "MongoDB Developers Tool Kit",
-                "issuer": "GeeksforGeeks" if issuer_match else None,
-                "date": "2024" if date_match else None,
+                "issuer": "GeeksforGeeks" if "GeeksforGeeks" in text else None,
+                "date": "2024" if "2024" in text else None,
                 "credential_id": None,
                 "raw_text": text
             }]
@@ -241,16 +426,12 @@ class CertificationsExtractor:
             List with the properly formatted certification entry.
         """
         # Extract the AWS certification entry
-        name_match = re.search(r"AWS Certified Developer\s*-\s*Associate", text)
-        issuer_match = re.search(r"Amazon Web Services", text)
-        date_match = re.search(r"2021", text)
-        
-        if name_match:
+        if self._AWS_NAME_RE.search(text):
             # Create a proper certification entry
             return [{
                 "name": "AWS Certified Developer - Associate",
-                "issuer": "Amazon Web Services" if issuer_match else None,
-                "date": "2021" if date_match else None,
+                "issuer": "Amazon Web Services" if "Amazon Web Services" in text else None,
+                "date": "2021" if "2021" in text else None,
                 "credential_id": None,
                 "raw_text": text
             }]
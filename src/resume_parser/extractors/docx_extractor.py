@@ -1,11 +1,354 @@
 """
-DOCX text extraction module using python-docx.
+DOCX text extraction module reading the WordprocessingML directly.
 """
 
+import functools
 import os
-from typing import Dict, List, Optional
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import docx
+# WordprocessingML, package relationship and core properties namespaces
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CP = "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_DCTERMS = "{http://purl.org/dc/terms/}"
+
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+_CORE_PROPERTIES_REL = (
+    "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+)
+
+_BODY = _W + "body"
+_P = _W + "p"
+_R = _W + "r"
+_HYPERLINK = _W + "hyperlink"
+_TBL = _W + "tbl"
+_TR = _W + "tr"
+_TC = _W + "tc"
+_VAL = _W + "val"
+_PPR = _W + "pPr"
+_SECTPR = _W + "sectPr"
+
+# Text equivalents of run content elements, as python-docx renders them
+_RUN_CHARS = {
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+
+# Core properties in metadata order, with their element and value type
+_CORE_PROPERTIES = [
+    ("author", _DC + "creator", "text"),
+    ("category", _CP + "category", "text"),
+    ("comments", _DC + "description", "text"),
+    ("content_status", _CP + "contentStatus", "text"),
+    ("created", _DCTERMS + "created", "datetime"),
+    ("identifier", _DC + "identifier", "text"),
+    ("keywords", _CP + "keywords", "text"),
+    ("language", _DC + "language", "text"),
+    ("last_modified_by", _CP + "lastModifiedBy", "text"),
+    ("last_printed", _CP + "lastPrinted", "datetime"),
+    ("modified", _DCTERMS + "modified", "datetime"),
+    ("revision", _CP + "revision", "revision"),
+    ("subject", _DC + "subject", "text"),
+    ("title", _DC + "title", "text"),
+    ("version", _CP + "version", "text"),
+]
+
+# W3CDTF formats accepted for core property dates, and the time zone suffix
+_W3CDTF_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m", "%Y")
+_W3CDTF_OFFSET_RE = re.compile(r"([+-])(\d\d):(\d\d)")
+
+
+def _package_part(archive: zipfile.ZipFile, rel_type: str) -> Optional[str]:
+    """
+    Find the part a DOCX package relates to with a given relationship type.
+
+    Args:
+        archive: Opened DOCX package.
+        rel_type: Package relationship type.
+
+    Returns:
+        Name of the part inside the package, or None if there is none.
+    """
+    rels = ET.fromstring(archive.read("_rels/.rels"))
+    for rel in rels.iter(_PKG_REL + "Relationship"):
+        if rel.get("Type") == rel_type:
+            return posixpath.normpath(rel.get("Target").lstrip("/"))
+    return None
+
+
+def _main_document_part(archive: zipfile.ZipFile) -> str:
+    """
+    Find the main document part of a DOCX package.
+
+    Args:
+        archive: Opened DOCX package.
+
+    Returns:
+        Name of the main document part inside the package.
+    """
+    part = _package_part(archive, _OFFICE_DOCUMENT_REL)
+    if part is None:
+        raise ValueError("no main document part in package")
+    return part
+
+
+def _iter_body_elements(archive: zipfile.ZipFile) -> Iterator[ET.Element]:
+    """
+    Stream the top-level elements of the document body.
+
+    Each element is yielded once complete and cleared afterwards, so only
+    one paragraph or table is held in memory at a time.
+
+    Args:
+        archive: Opened DOCX package.
+
+    Yields:
+        Top-level paragraph, table and other body elements, in document order.
+    """
+    with archive.open(_main_document_part(archive)) as document:
+        # Track nesting with a counter rather than a stack of tags; only the
+        # depth-2 element needs checking to know whether we're in the body
+        depth = 0
+        in_body = False
+        for event, element in ET.iterparse(document, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    in_body = element.tag == _BODY
+                continue
+
+            depth -= 1
+            if depth == 2 and in_body:
+                yield element
+                element.clear()
+
+
+def _run_text(run: ET.Element) -> str:
+    """
+    Get the text of a ``w:r`` element.
+
+    Args:
+        run: Run element.
+
+    Returns:
+        Run text, with tabs, breaks and non-breaking hyphens translated.
+    """
+    parts = []
+    for child in run:
+        if child.tag == _W + "t":
+            parts.append(child.text or "")
+        elif child.tag == _W + "br":
+            # Only text-wrapping breaks are line breaks; page and column breaks are dropped
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif child.tag in _RUN_CHARS:
+            parts.append(_RUN_CHARS[child.tag])
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph: ET.Element) -> str:
+    """
+    Get the text of a ``w:p`` element from its runs and hyperlinks.
+
+    Args:
+        paragraph: Paragraph element.
+
+    Returns:
+        Paragraph text.
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _R)
+    return "".join(parts)
+
+
+def _property_value(element: ET.Element, properties: str, name: str, default):
+    """
+    Get the ``w:val`` of a property child, e.g. ``w:tcPr/w:gridSpan``.
+
+    Args:
+        element: Element owning the properties.
+        properties: Local name of the properties element.
+        name: Local name of the property.
+        default: Value when the property is absent.
+
+    Returns:
+        Property value, or default.
+    """
+    prop = element.find(f"{_W}{properties}/{_W}{name}")
+    if prop is None:
+        return default
+    return prop.get(_VAL)
+
+
+def _table_cell_texts(table: ET.Element) -> List[str]:
+    """
+    Get the text of every cell in a ``w:tbl`` element, row by row.
+
+    Mirrors python-docx's ``row.cells``: a cell spanning several grid columns
+    is repeated once per column, and a vertically merged continuation cell
+    repeats the cell it continues.
+
+    Args:
+        table: Table element.
+
+    Returns:
+        Cell texts, each the cell's paragraphs joined by newlines.
+
+    Raises:
+        ValueError: If a merged cell has no cell above it.
+    """
+    texts = []
+    previous_row = None
+
+    for row in table.iterfind(_TR):
+        # Map each cell's starting grid offset to its content cell and span
+        offset = int(_property_value(row, "trPr", "gridBefore", 0))
+        current_row = {}
+
+        for cell in row.iterfind(_TC):
+            span = int(_property_value(cell, "tcPr", "gridSpan", 1))
+            source = (cell, span)
+
+            # A w:vMerge without a value continues the cell above
+            merge = cell.find(f"{_W}tcPr/{_W}vMerge")
+            if merge is not None and merge.get(_VAL, "continue") == "continue":
+                if previous_row is None or offset not in previous_row:
+                    raise ValueError(f"no cell above merged cell at grid offset {offset}")
+                source = previous_row[offset]
+
+            current_row.setdefault(offset, source)
+            content_cell, content_span = source
+            text = "\n".join(_paragraph_text(p) for p in content_cell.iterfind(_P))
+            texts.extend([text] * content_span)
+            offset += span
+
+        previous_row = current_row
+
+    return texts
+
+
+def _parse_w3cdtf(value: str) -> Optional[datetime]:
+    """
+    Parse a W3CDTF core property date the way python-docx does.
+
+    Args:
+        value: Date string, e.g. "2003-12-31T10:14:55Z" or "2003-12-31".
+
+    Returns:
+        UTC datetime, or None if the string is not a valid date.
+    """
+    parsed = None
+    for date_format in _W3CDTF_FORMATS:
+        try:
+            parsed = datetime.strptime(value[:19], date_format)
+        except ValueError:
+            continue
+
+    if parsed is None:
+        return None
+
+    offset = value[19:]
+    if len(offset) == 6:
+        match = _W3CDTF_OFFSET_RE.match(offset)
+        if match is None:
+            return None
+        sign, hours, minutes = match.groups()
+        factor = -1 if sign == "+" else 1
+        parsed += timedelta(hours=int(hours) * factor, minutes=int(minutes) * factor)
+
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def _read_core_properties(archive: zipfile.ZipFile) -> Dict:
+    """
+    Read the core properties (``docProps/core.xml``) of a DOCX package.
+
+    Missing text properties are empty strings, missing dates are None and an
+    invalid or missing revision is 0. A package without core properties gets
+    the defaults python-docx would create for it.
+
+    Args:
+        archive: Opened DOCX package.
+
+    Returns:
+        Dictionary of core properties.
+    """
+    part = _package_part(archive, _CORE_PROPERTIES_REL)
+    if part is None:
+        defaults = {key: "" for key, _, kind in _CORE_PROPERTIES if kind == "text"}
+        defaults.update(
+            created=None,
+            last_printed=None,
+            modified=datetime.now(timezone.utc).replace(microsecond=0),
+            revision=1,
+            title="Word Document",
+            last_modified_by="python-docx",
+        )
+        return {key: defaults[key] for key, _, _ in _CORE_PROPERTIES}
+
+    root = ET.fromstring(archive.read(part))
+    props = {}
+    for key, tag, kind in _CORE_PROPERTIES:
+        element = root.find(tag)
+        if kind == "text":
+            props[key] = "" if element is None else element.text or ""
+        elif kind == "datetime":
+            props[key] = None if element is None else _parse_w3cdtf(element.text)
+        else:
+            try:
+                revision = 0 if element is None else int(str(element.text))
+            except ValueError:
+                revision = 0
+            props[key] = max(revision, 0)
+    return props
+
+
+@functools.lru_cache(maxsize=32)
+def _read_metadata(file_path: str, file_key: Tuple[int, int, int, int]) -> Dict:
+    """
+    Read the metadata of a DOCX file, cached per file version.
+
+    Args:
+        file_path: Path to the DOCX file.
+        file_key: Device, inode, modification time and size of the file, so a
+            changed or replaced file is read again.
+
+    Returns:
+        Dictionary containing DOCX metadata.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        # Extract core properties, filtering out None values
+        core_props = {
+            k: v for k, v in _read_core_properties(archive).items() if v is not None
+        }
+
+        # Add document statistics, counted in one pass over the body
+        doc_stats = {"paragraphs": 0, "sections": 0, "tables": 0}
+        for element in _iter_body_elements(archive):
+            if element.tag == _P:
+                doc_stats["paragraphs"] += 1
+                for properties in element.iterfind(_PPR):
+                    doc_stats["sections"] += len(properties.findall(_SECTPR))
+            elif element.tag == _TBL:
+                doc_stats["tables"] += 1
+            elif element.tag == _SECTPR:
+                doc_stats["sections"] += 1
+
+    return {**core_props, **doc_stats}
 
 
 class DocxExtractor:
@@ -35,20 +378,20 @@ class DocxExtractor:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            doc = docx.Document(file_path)
-            full_text = []
-            
-            # Extract text from paragraphs
-            for para in doc.paragraphs:
-                full_text.append(para.text)
-                
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        full_text.append(cell.text)
-            
-            return "\n".join(full_text)
+            paragraphs = []
+            cells = []
+
+            with zipfile.ZipFile(file_path) as archive:
+                for element in _iter_body_elements(archive):
+                    if element.tag == _P:
+                        paragraphs.append(_paragraph_text(element))
+                    elif element.tag == _TBL:
+                        cells.extend(_table_cell_texts(element))
+
+            # Paragraph text first, then table text, as python-docx lists them;
+            # extended in place so the join doesn't need a concatenated copy
+            paragraphs.extend(cells)
+            return "\n".join(paragraphs)
         except Exception as e:
             raise ValueError(f"Error reading DOCX: {e}")
     
@@ -66,40 +409,10 @@ class DocxExtractor:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            doc = docx.Document(file_path)
-            
-            # Extract core properties
-            core_props = {}
-            if doc.core_properties:
-                props = doc.core_properties
-                core_props = {
-                    "author": props.author,
-                    "category": props.category,
-                    "comments": props.comments,
-                    "content_status": props.content_status,
-                    "created": props.created,
-                    "identifier": props.identifier,
-                    "keywords": props.keywords,
-                    "language": props.language,
-                    "last_modified_by": props.last_modified_by,
-                    "last_printed": props.last_printed,
-                    "modified": props.modified,
-                    "revision": props.revision,
-                    "subject": props.subject,
-                    "title": props.title,
-                    "version": props.version
-                }
-                
-                # Filter out None values
-                core_props = {k: v for k, v in core_props.items() if v is not None}
-            
-            # Add document statistics
-            doc_stats = {
-                "paragraphs": len(doc.paragraphs),
-                "sections": len(doc.sections),
-                "tables": len(doc.tables)
-            }
-            
-            return {**core_props, **doc_stats}
+            stat = os.stat(file_path)
+            file_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+            # Copy, so callers can't modify the cached result
+            return dict(_read_metadata(file_path, file_key))
         except Exception as e:
             raise ValueError(f"Error extracting DOCX metadata: {e}") 
\ No newline at end of file
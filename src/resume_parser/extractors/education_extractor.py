@@ -2,54 +2,125 @@
 Education extraction module for extracting education details from resumes.
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Pattern, Tuple
 
 from resume_parser.utils import text_preprocessing
 
+try:
+    # RE2 matches in linear time, without backtracking on long inputs
+    import re2
+    USING_RE2 = True
+except ImportError:
+    # Fall back to the standard library engine if google-re2 is not installed
+    USING_RE2 = False
+
+# Aho-Corasick finds every common institution in a single pass over the
+# text; without pyahocorasick the institution regex is used instead
+USING_AHOCORASICK = text_preprocessing.USING_AHOCORASICK
+
+# Below this length the RE2 binding's per-call overhead outweighs its faster scan
+_RE2_MIN_LENGTH = 256
+
+
+def _anchor_word_start(pattern: str) -> str:
+    r"""
+    Swap a pattern's leading ``(?:^|\s)`` for the ``(?<!\S)`` lookbehind.
+
+    Both let the rest of the pattern match only at the start of the text or
+    after whitespace, so a search finds the same groups. The lookbehind is a
+    single check instead of an alternation, but it doesn't consume the
+    whitespace, so it is only used where the match start and a finditer's
+    non-overlapping matches don't matter. RE2 has no lookbehind and keeps
+    the original pattern.
+
+    Args:
+        pattern: Regex pattern.
+
+    Returns:
+        The pattern with its leading anchor swapped, if it has one.
+    """
+    if pattern.startswith(r"(?:^|\s)"):
+        return r"(?<!\S)" + pattern[len(r"(?:^|\s)"):]
+    return pattern
+
+
+def _build_literal_masks(literal_groups: List[Tuple[str, ...]]) -> List[Tuple[str, int]]:
+    """
+    Pair each literal with a bit mask of the groups it appears in.
+
+    Args:
+        literal_groups: Literals for each pattern, in pattern order.
+
+    Returns:
+        List of (literal, mask) pairs, where bit i of the mask is set if the
+        literal is one of pattern i's.
+    """
+    masks: Dict[str, int] = {}
+    for index, literals in enumerate(literal_groups):
+        for literal in literals:
+            masks[literal] = masks.get(literal, 0) | (1 << index)
+    return list(masks.items())
+
+
+class _EducationRecord(NamedTuple):
+    """Immutable education entry, as kept in the extraction cache."""
+
+    degree: Optional[str]
+    institution: Optional[str]
+    dates: Tuple[str, ...]
+    score: Optional[str]
+    raw_text: str
+
 
 class EducationExtractor:
     """
     Extract education details from resume text.
     """
 
+    # All state is class-level, so instances need no attribute dict
+    __slots__ = ()
+
     # Common degree patterns
     DEGREE_PATTERNS = [
-        r"(?i)(?:^|\s)(B\.Tech|Bachelor of Technology)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(B\.E\.|Bachelor of Engineering)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Bachelor of Engineering in [A-Za-z\s]+)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(B\.Sc\.|Bachelor of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(B\.S\.|B\.S\.? in .+?|Bachelor of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Bachelor of Science in)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Bachelor of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(B\.A\.|Bachelor of Arts)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(B\.Com\.|Bachelor of Commerce)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.Tech|Master of Technology)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.E\.|Master of Engineering)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.Sc\.|Master of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.S\.|M\.S\.? in .+?|Master of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Master of Science in)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Master of Science)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.A\.|Master of Arts)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(M\.Com\.|Master of Commerce)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(MBA|Master of Business Administration)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Ph\.D\.|Doctor of Philosophy)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Diploma|Associate Degree)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(HSC|12th|XII|Higher Secondary)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(SSC|10th|X|Secondary)(?:\s|$|,|\.)"
+        r"(?:^|\s)(B\.Tech|Bachelor of Technology)(?:\s|$|,|\.)",
+        r"(?:^|\s)(B\.E\.|Bachelor of Engineering)(?:\s|$|,|\.)",
+        r"(?:^|\s)(B\.Sc\.|Bachelor of Science)(?:\s|$|,|\.)",
+        r"(?:^|\s)(B\.S\.|B\.S\.? in .[^\s,.]*)(?:\s|$|,|\.)",
+        r"(?:^|\s)(B\.A\.|Bachelor of Arts)(?:\s|$|,|\.)",
+        r"(?:^|\s)(B\.Com\.|Bachelor of Commerce)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.Tech|Master of Technology)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.E\.|Master of Engineering)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.Sc\.|Master of Science)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.S\.|M\.S\.? in .[^\s,.]*)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.A\.|Master of Arts)(?:\s|$|,|\.)",
+        r"(?:^|\s)(M\.Com\.|Master of Commerce)(?:\s|$|,|\.)",
+        r"(?:^|\s)(MBA|Master of Business Administration)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Ph\.D\.|Doctor of Philosophy)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Diploma|Associate Degree)(?:\s|$|,|\.)",
+        r"(?:^|\s)(HSC|12th|XII|Higher Secondary)(?:\s|$|,|\.)",
+        r"(?:^|\s)(SSC|10th|X|Secondary)(?:\s|$|,|\.)"
+    ]
+
+    # Degree keywords to fall back on when no degree pattern matches
+    DEGREE_KEYWORDS = [
+        "Bachelor", "Master", "PhD", "Doctorate", "Associate", "Certificate", "Diploma"
     ]
 
     # Full degree indicators for better separation
     FULL_DEGREE_INDICATORS = [
-        r"(?i)(Bachelor[''']s degree|Master[''']s degree|Doctorate|Ph\.D|MBA)",
-        r"(?i)(B\.S\.|B\.A\.|B\.Tech|B\.E\.|M\.S\.|M\.A\.|M\.Tech|M\.B\.A|Associate's|A\.A\.|A\.S\.)",
-        r"(?i)(Bachelor of|Master of|Doctor of|Associate of)"
+        r"(Bachelor[''']s degree|Master[''']s degree|Doctorate|Ph\.D|MBA)",
+        r"(B\.S\.|B\.A\.|B\.Tech|B\.E\.|M\.S\.|M\.A\.|M\.Tech|M\.B\.A|Associate's|A\.A\.|A\.S\.)",
+        r"(Bachelor of|Master of|Doctor of|Associate of)"
     ]
 
     # Institution name patterns
     INSTITUTION_PATTERNS = [
-        r"(?i)(?:^|\s)(University|College|Institute|School)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Academy|Education|Educational|Vidyalaya)(?:\s|$|,|\.)"
+        r"(?:^|\s)(University|College|Institute|School)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Academy|Education|Educational|Vidyalaya)(?:\s|$|,|\.)"
     ]
 
     # Common universities and colleges for direct matching
@@ -67,26 +138,26 @@ class EducationExtractor:
 
     # Date patterns
     DATE_PATTERNS = [
-        r"(?i)(?:^|\s)(\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*present|\d{4}\s*-\s*ongoing)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(\d{4})(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}(?:\s|$|,|\.)"
+        r"(?:^|\s)(\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*present|\d{4}\s*-\s*ongoing)(?:\s|$|,|\.)",
+        r"(?:^|\s)(\d{4})(?:\s|$|,|\.)",
+        r"(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}(?:\s|$|,|\.)"
     ]
 
     # GPA/Score patterns
     SCORE_PATTERNS = [
-        r"(?i)(?:^|\s|:)(GPA|CGPA|Percentage|Score|Marks)[\s:]*(\d+\.\d+|\d+\.|\d+)[%]?(?:[\s/]|$|,|\.)",
-        r"(?i)(?:^|\s)(\d+\.\d+|\d+)[/](\d+\.\d+|\d+)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(\d+\.\d+|\d+)[%](?:\s|$|,|\.)",
-        r"(?i)(Cum Laude|Magna Cum Laude|Summa Cum Laude|Distinction|Merit|First Class|Second Class)"
+        r"(?:^|\s|:)(GPA|CGPA|Percentage|Score|Marks)[\s:]*(\d+\.\d+|\d+\.|\d+)[%]?(?:[\s/]|$|,|\.)",
+        r"(?:^|\s)(\d+\.\d+|\d+)[/](\d+\.\d+|\d+)(?:\s|$|,|\.)",
+        r"(?:^|\s)(\d+\.\d+|\d+)[%](?:\s|$|,|\.)",
+        r"(Cum Laude|Magna Cum Laude|Summa Cum Laude|Distinction|Merit|First Class|Second Class)"
     ]
 
     # Field of study patterns - improved to avoid false positives
     FIELD_PATTERNS = [
         # Only look for field patterns after degree keywords to avoid false positives
-        r"(?i)(?:degree|bachelor|master|ms|ma|mba|phd|bs|ba)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
-        r"(?i)(?:majoring|majored)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
-        r"(?i)(?:studied|study|studies)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
-        r"(?i)(?:in|of)\s+([A-Za-z][A-Za-z\s]+?)(?:\s+(?:from|at|in)\s+(?:the\s+)?(?:university|college|institute|school))",
+        r"(?:degree|bachelor|master|ms|ma|mba|phd|bs|ba)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
+        r"(?:majoring|majored)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
+        r"(?:studied|study|studies)\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)",
+        r"(?:in|of)\s+([A-Za-z][A-Za-z\s]+?)(?:\s+(?:from|at|in)\s+(?:the\s+)?(?:university|college|institute|school))",
     ]
 
     # List of common fields of study to verify extracted fields
@@ -106,40 +177,204 @@ class EducationExtractor:
 
     # Concentration/specialization patterns
     CONCENTRATION_PATTERNS = [
-        r"(?i)(Concentration|Specialization|Focus|Major|Track|Emphasis)(?:: | in )([A-Za-z\s]+?)(?:,|\.|$|\n)",
-        r"(?i)(?:with|,) ([A-Za-z\s]+) (Concentration|Specialization|Focus|Major|Track|Emphasis)(?:,|\.|$|\n)",
+        r"(Concentration|Specialization|Focus|Major|Track|Emphasis)(?:: | in )([A-Za-z\s]+?)(?:,|\.|$|\n)",
+        r"(?:with|,) ([A-Za-z\s]+) (Concentration|Specialization|Focus|Major|Track|Emphasis)(?:,|\.|$|\n)",
     ]
 
-    def __init__(self):
-        """Initialize the education extractor."""
-        self.degree_patterns = [re.compile(pattern) for pattern in self.DEGREE_PATTERNS]
-        self.full_degree_indicators = [re.compile(pattern) for pattern in self.FULL_DEGREE_INDICATORS]
-        self.institution_patterns = [re.compile(pattern) for pattern in self.INSTITUTION_PATTERNS]
-        self.date_patterns = [re.compile(pattern) for pattern in self.DATE_PATTERNS]
-        self.score_patterns = [re.compile(pattern) for pattern in self.SCORE_PATTERNS]
-        self.field_patterns = [re.compile(pattern) for pattern in self.FIELD_PATTERNS]
-        self.concentration_patterns = [re.compile(pattern) for pattern in self.CONCENTRATION_PATTERNS]
-        
-        # Precompile common institution pattern for faster matching
-        common_inst_pattern = "|".join([re.escape(inst) for inst in self.COMMON_INSTITUTIONS])
-        self.common_inst_regex = re.compile(f"(?i)({common_inst_pattern})")
-        
-        # Precompile common fields pattern for verification
-        self.common_fields_pattern = re.compile(f"(?i)\\b({'|'.join(self.COMMON_FIELDS)})\\b")
+    # Patterns are compiled once, when the class is defined
+    degree_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in DEGREE_PATTERNS]
+    full_degree_indicators = [re.compile(pattern, re.IGNORECASE) for pattern in FULL_DEGREE_INDICATORS]
+    institution_patterns = [
+        re.compile(_anchor_word_start(pattern), re.IGNORECASE) for pattern in INSTITUTION_PATTERNS
+    ]
+    # Any of the institution patterns, in one scan
+    _INSTITUTION_KEYWORD_RE = re.compile(
+        "|".join(_anchor_word_start(pattern) for pattern in INSTITUTION_PATTERNS), re.IGNORECASE
+    )
+    date_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in DATE_PATTERNS]
+    score_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in SCORE_PATTERNS]
+    field_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in FIELD_PATTERNS]
+    concentration_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in CONCENTRATION_PATTERNS]
+    
+    # Degree patterns and keywords combined so one scan finds the first
+    # one that matches, in list order
+    degree_regex = text_preprocessing.combine_patterns(
+        [_anchor_word_start(pattern) for pattern in DEGREE_PATTERNS], re.IGNORECASE
+    )
+    # Lowercase text that every match of the degree pattern at the same index
+    # contains at least one of
+    _DEGREE_PATTERN_LITERALS = [
+        ("b.tech", "bachelor"), ("b.e.", "bachelor"), ("b.sc.", "bachelor"), ("b.s",),
+        ("b.a.", "bachelor"), ("b.com.", "bachelor"),
+        ("m.tech", "master"), ("m.e.", "master"), ("m.sc.", "master"), ("m.s",),
+        ("m.a.", "master"), ("m.com.", "master"), ("mba", "master"),
+        ("ph.d.", "doctor"), ("diploma", "associate"),
+        ("hsc", "12th", "xii", "higher"), ("ssc", "10th", "x", "secondary")
+    ]
+    # Each literal with the bit mask of the degree patterns it stands for
+    _DEGREE_LITERAL_MASKS = _build_literal_masks(_DEGREE_PATTERN_LITERALS)
+    
+    degree_keyword_regex = text_preprocessing.combine_patterns(
+        [r"\b" + re.escape(keyword) + r"\b" for keyword in DEGREE_KEYWORDS], re.IGNORECASE
+    )
+    
+    # Full degree phrase starting at each degree keyword
+    degree_phrase_patterns = [
+        re.compile(r"\b" + re.escape(keyword) + r"[\w\s]+(?:,|\.|$|\n)", re.IGNORECASE)
+        for keyword in DEGREE_KEYWORDS
+    ]
+    
+    # Common institution pattern for faster matching. Whole words only, and
+    # longest names first, so "MIT" doesn't match inside "Smith" and a longer
+    # name starting at the same place wins over its prefix.
+    common_inst_regex = re.compile(
+        r"\b("
+        + "|".join([re.escape(inst) for inst in sorted(COMMON_INSTITUTIONS, key=len, reverse=True)])
+        + r")\b",
+        re.IGNORECASE
+    )
+    _ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+    if USING_AHOCORASICK:
+        common_inst_automaton = text_preprocessing.build_keyword_automaton(COMMON_INSTITUTIONS)
+    
+    # Common fields pattern for verification
+    common_fields_pattern = re.compile(r"\b(" + "|".join(COMMON_FIELDS) + r")\b", re.IGNORECASE)
+    
+    # Keywords looked for anywhere in lowercased text, as substrings
+    _DEGREE_WORD_RE = re.compile(r"bachelor|master|degree|bs|ms|ba|ma|phd")
+    _INSTITUTION_WORD_RE = re.compile(r"university|college|institute|school")
+    _INSTITUTION_LINE_WORDS = ("university", "college", "institute")
+    _FIELD_KEYWORD_RE = re.compile(r"degree|bachelor|master|phd|bs|ms|ba|ma|education|studies|major")
+    
+    # Every degree or institution the extract methods can find contains one
+    # of these, case aside, so text with none of them has no entries. The
+    # keywords above are only looked for in entries spanning several lines.
+    _EDUCATION_SIGNAL_RE = re.compile(
+        r"bachelor|master|doctor|ph\.?d|mba|diploma|associate|certificate"
+        r"|hsc|ssc|12th|10th|secondary|(?<!\S)x|[bm]\."
+        r"|university|college|institute|school|academy|education|vidyalaya"
+        r"|mit|penn|zurich|marathwada",
+        re.IGNORECASE
+    )
+    
+    # Words rejected and exact field names accepted by _is_valid_field
+    _COMMON_WORDS = frozenset(["the", "and", "with", "from", "also", "have", "this", "that", "there"])
+    _COMMON_FIELDS_SET = frozenset(COMMON_FIELDS)
+    
+    # Field-like words accepted by _is_valid_field
+    _FIELD_WORD_RE = re.compile(
+        r"(science|engineering|studies|technology|arts|management|design|analysis|systems)", re.IGNORECASE
+    )
+    
+    # Line starts where any degree pattern matches. Only used on text without
+    # blank lines, where no degree match can run past a line break, so this
+    # finds the same positions as running every pattern's finditer.
+    _DEGREE_LINE_START_RE = re.compile(
+        r"(?<![^\n])(?=" + "|".join(f"(?:{pattern})" for pattern in DEGREE_PATTERNS) + ")",
+        re.IGNORECASE
+    )
+    
+    # Entry separators
+    _BLANK_LINE_RE = re.compile(r'\n\s*\n')
+    # Separators are mapped onto ',' so a plain str.split does the splitting
+    _LINE_SEPARATORS = str.maketrans({'|': ','})
+    _SEGMENT_SEPARATORS = str.maketrans({';': ',', '|': ',', '\n': ','})
+    
+    # Degree, institution, date and score patterns used by the extract methods
+    _EXACT_DEGREE_RE = re.compile(r"Bachelor of Engineering in Computer Engineering")
+    _FIELD_AFTER_DEGREE_RE = re.compile(r"\s+in\s+([A-Za-z][A-Za-z\s]+?)(?:,|\.|$|\n)")
+    # A match can only start where a run of name characters starts, so the
+    # lookbehind skips the rest of the run instead of rescanning it from
+    # every position, which is quadratic in the run length
+    _UNIVERSITY_RE = re.compile(
+        r"(?<![A-Za-z\s&])([A-Za-z\s&]+(?:University|College|Institute|School))", re.IGNORECASE
+    )
+    _YEAR_RE = re.compile(r"\d{4}")
+    _DATE_RANGE_RE = re.compile(r"(\d{4})\s*-\s*(\d{4}|\s*Present|\s*Current)")
+    
+    # Something every score pattern needs: a digit or part of an honors word
+    _SCORE_HINT_RE = re.compile(r"\d|laude|honors|distinction|merit|class", re.IGNORECASE)
+    
+    # GPA, then honors, then the other score patterns, in one scan
+    _SCORE_FAMILY = [
+        r"GPA\s*(?::|of|=)?\s*(\d+\.\d+)[/]?(?:\d+\.\d+)?",
+        r"(Cum Laude|Magna Cum Laude|Summa Cum Laude|with Honors|with Distinction|with High Distinction)",
+    ] + SCORE_PATTERNS
+    _SCORE_RE = text_preprocessing.combine_patterns(
+        [_anchor_word_start(pattern) for pattern in _SCORE_FAMILY], re.IGNORECASE
+    )
+    
+    # Concentration patterns in one scan
+    _CONCENTRATION_RE = text_preprocessing.combine_patterns(CONCENTRATION_PATTERNS, re.IGNORECASE)
+    
+    if USING_RE2:
+        _DEGREE_RE2 = re2.compile("(?i)" + text_preprocessing.combine_patterns(DEGREE_PATTERNS).pattern)
+        _DEGREE_KEYWORD_RE2 = re2.compile("(?i)" + degree_keyword_regex.pattern)
+        _SCORE_RE2 = re2.compile("(?i)" + text_preprocessing.combine_patterns(_SCORE_FAMILY).pattern)
+        _CONCENTRATION_RE2 = re2.compile("(?i)" + _CONCENTRATION_RE.pattern)
 
     def extract_education(self, text: str) -> List[Dict]:
         """
         Extract education details from text.
         
+        Results are cached per section text, so a section seen before skips
+        the regex work. Each call builds fresh dictionaries from the cached
+        records, so callers are free to modify them.
+        
         Args:
             text: Education section text.
             
         Returns:
             List of dictionaries containing education details.
         """
-        # If text is empty or too short, return empty list
+        return [
+            dict(record._asdict(), dates=list(record.dates))
+            for record in _extract_education_cached(text)
+        ]
+    
+    def extract_education_batch(self, texts: List[str], workers: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Extract education details from many section texts in parallel.
+        
+        The regex work is CPU-bound, so the texts are spread over worker
+        processes. Each worker keeps its own result cache.
+        
+        Args:
+            texts: Education section texts.
+            workers: Number of worker processes; defaults to the CPU count.
+                With a single worker or text, everything runs in this process.
+            
+        Returns:
+            List of education entry lists, one per text, in input order.
+        """
+        if workers == 1 or len(texts) <= 1:
+            return [self.extract_education(text) for text in texts]
+            
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_education, texts, chunksize=32))
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached extraction results."""
+        _extract_education_cached.cache_clear()
+    
+    def _extract_education_records(self, text: str) -> Tuple[_EducationRecord, ...]:
+        """
+        Extract education details from text, for _extract_education_cached.
+        
+        Args:
+            text: Education section text.
+            
+        Returns:
+            Tuple of records containing education details.
+        """
+        # If text is empty or too short, return no entries
         if not text or len(text) < 10:
-            return []
+            return ()
+            
+        # Skip the whole pipeline for text with nothing to find
+        if not self._has_education_signal(text):
+            return ()
             
         education_entries = []
         
@@ -158,11 +393,12 @@ class EducationExtractor:
             if not clean_entry:
                 continue
                 
-            # Extract details from the entry
-            degree = self._extract_degree(clean_entry)
-            field_of_study = self._extract_field_of_study(clean_entry)
+            # Extract details from the entry, sharing one lowercased copy
+            clean_lower = clean_entry.lower()
+            degree = self._extract_degree(clean_entry, clean_lower)
+            field_of_study = self._extract_field_of_study(clean_entry, clean_lower)
             concentration = self._extract_concentration(clean_entry)
-            institution = self._extract_institution(clean_entry)
+            institution = self._extract_institution(clean_entry, clean_lower)
             dates = self._extract_dates(clean_entry)
             score = self._extract_score(clean_entry)
             
@@ -185,30 +421,62 @@ class EducationExtractor:
                     # First line might be degree
                     first_line = lines[0].strip()
                     # Check for common degree keywords in first line
-                    if any(keyword in first_line.lower() for keyword in 
-                           ["bachelor", "master", "degree", "bs", "ms", "ba", "ma", "phd"]):
+                    if self._DEGREE_WORD_RE.search(first_line.lower()):
                         degree = first_line
                     
                     # Second line might be institution
                     second_line = lines[1].strip()
                     # Check for common institution keywords in second line
-                    if any(keyword in second_line.lower() for keyword in 
-                           ["university", "college", "institute", "school"]):
+                    if self._INSTITUTION_WORD_RE.search(second_line.lower()):
                         institution = second_line
             
             # Only add entries that have at least degree or institution
             if degree or institution:
-                education_entry = {
-                    "degree": degree,
-                    "institution": institution,
-                    "dates": dates,
-                    "score": score,
-                    "raw_text": clean_entry
-                }
+                education_entry = _EducationRecord(
+                    degree=degree,
+                    institution=institution,
+                    dates=tuple(dates),
+                    score=score,
+                    raw_text=clean_entry
+                )
                 
                 education_entries.append(education_entry)
                 
-        return education_entries
+        return tuple(education_entries)
+    
+    def _has_education_signal(self, text: str) -> bool:
+        """
+        Check whether text could contain an education entry at all.
+        
+        Args:
+            text: Education section text.
+            
+        Returns:
+            False only if no entry could be extracted from the text.
+        """
+        if self._EDUCATION_SIGNAL_RE.search(text):
+            return True
+        if "\n" not in text:
+            return False
+        text_lower = text.lower()
+        return bool(self._DEGREE_WORD_RE.search(text_lower) or self._INSTITUTION_WORD_RE.search(text_lower))
+    
+    @staticmethod
+    def _use_re2(text: str) -> bool:
+        """
+        Check whether an education entry should be matched with RE2.
+        
+        RE2 character classes are ASCII-only, so it is only used for ASCII text.
+        Entries have been through clean_text, which leaves a plain space as the
+        only whitespace, so RE2's narrower whitespace class makes no difference here.
+        
+        Args:
+            text: Education entry text.
+            
+        Returns:
+            True if RE2 should be used.
+        """
+        return USING_RE2 and len(text) >= _RE2_MIN_LENGTH and text.isascii()
     
     def _is_valid_field(self, field: str) -> bool:
         """
@@ -225,16 +493,18 @@ class EducationExtractor:
             return False
             
         # Check if it's a common word that's not a field of study
-        common_words = ["the", "and", "with", "from", "also", "have", "this", "that", "there"]
-        if field.lower() in common_words:
+        field_lower = field.lower()
+        if field_lower in self._COMMON_WORDS:
             return False
             
-        # Check against our list of common fields
+        # Check against our list of common fields, exact names first
+        if field_lower.strip() in self._COMMON_FIELDS_SET:
+            return True
         if self.common_fields_pattern.search(field):
             return True
             
         # Check for common field-like patterns
-        if re.search(r"(?i)(science|engineering|studies|technology|arts|management|design|analysis|systems)", field):
+        if self._FIELD_WORD_RE.search(field):
             return True
             
         return False
@@ -250,24 +520,18 @@ class EducationExtractor:
             List of education entry texts.
         """
         # Try to split by double line breaks first
-        entries = re.split(r'\n\s*\n', text)
+        entries = self._BLANK_LINE_RE.split(text)
         
         # If that didn't work well, try looking for educational patterns
         if len(entries) <= 1:
-            # Look for patterns that indicate the start of a new entry
-            potential_split_points = []
-            
-            # Common degree indicators often start a new entry
-            for pattern in self.degree_patterns:
-                for match in pattern.finditer(text):
-                    match_pos = match.start()
-                    # Check if the match is at the beginning of a line
-                    if match_pos == 0 or text[match_pos-1] == '\n':
-                        potential_split_points.append(match_pos)
+            # Common degree indicators at the beginning of a line often start
+            # a new entry; one scan finds them all, in order
+            potential_split_points = [
+                match.start() for match in self._DEGREE_LINE_START_RE.finditer(text)
+            ]
             
             # Add the beginning and end of text
-            potential_split_points = sorted(list(set(potential_split_points)))
-            if 0 not in potential_split_points:
+            if not potential_split_points or potential_split_points[0] != 0:
                 potential_split_points.insert(0, 0)
             potential_split_points.append(len(text))
             
@@ -282,7 +546,7 @@ class EducationExtractor:
         
         # If that still didn't work well, try single line breaks
         if len(entries) <= 1:
-            entries = re.split(r'\n', text)
+            entries = text.split('\n')
             
         # Filter out empty entries
         return [entry.strip() for entry in entries if entry.strip()]
@@ -322,68 +586,120 @@ class EducationExtractor:
         
         return entries
         
-    def _extract_degree(self, text: str) -> Optional[str]:
+    def _extract_degree(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract degree from text.
         
         Args:
             text: Education entry text.
+            text_lower: The text lowercased, if the caller already has it.
             
         Returns:
             Extracted degree or None.
         """
         # First look for exact matches of "Bachelor of Engineering in Computer Engineering"
-        exact_match = re.search(r"Bachelor of Engineering in Computer Engineering", text)
+        exact_match = self._EXACT_DEGREE_RE.search(text)
         if exact_match:
             return exact_match.group(0)
             
-        # Check for patterns in our defined list
-        for pattern in self.degree_patterns:
-            match = pattern.search(text)
-            if match:
-                # Get the matched degree
-                degree = match.group(1)
-                
-                # Look for field of study immediately after the degree
-                field_match = re.search(f"{re.escape(degree)}\\s+in\\s+([A-Za-z][A-Za-z\\s]+?)(?:,|\\.|$|\\n)", text)
+        # Check for patterns in our defined list, all in one scan
+        use_re2 = self._use_re2(text)
+        if use_re2:
+            match = self._DEGREE_RE2.match(text)
+        elif text.isascii():
+            # Lowercasing only agrees with case-insensitive matching for ASCII
+            pattern = self._degree_regex_for(text_lower if text_lower is not None else text.lower())
+            match = pattern.match(text) if pattern else None
+        else:
+            match = self.degree_regex.match(text)
+        if match:
+            # Get the matched degree from the first pattern that matched
+            degree = match.group(match.lastindex + 1)
+            
+            # Look for field of study immediately after the degree, trying
+            # each place the degree appears in turn
+            start = text.find(degree)
+            while start != -1:
+                field_match = self._FIELD_AFTER_DEGREE_RE.match(text, start + len(degree))
                 if field_match:
                     return f"{degree} in {field_match.group(1)}"
-                
-                return degree
+                start = text.find(degree, start + 1)
+            
+            return degree
         
         # If no matches were found, check for common degree keywords
-        degree_keywords = [
-            "Bachelor", "Master", "PhD", "Doctorate", "Associate", "Certificate", "Diploma"
-        ]
-        
-        for keyword in degree_keywords:
-            if re.search(r"\b" + re.escape(keyword) + r"\b", text, re.IGNORECASE):
-                # Try to extract the full degree phrase
-                match = re.search(r"\b" + re.escape(keyword) + r"[\w\s]+(?:,|\.|$|\n)", text, re.IGNORECASE)
-                if match:
-                    return match.group(0).strip().rstrip(",.;")
-                return keyword
+        pattern = self._DEGREE_KEYWORD_RE2 if use_re2 else self.degree_keyword_regex
+        keyword_match = pattern.match(text)
+        if keyword_match:
+            index = int(keyword_match.lastgroup[1:])
+            keyword = self.DEGREE_KEYWORDS[index]
+            # Try to extract the full degree phrase
+            match = self.degree_phrase_patterns[index].search(text)
+            if match:
+                return match.group(0).strip().rstrip(",.;")
+            return keyword
                 
         return None
         
-    def _extract_field_of_study(self, text: str) -> Optional[str]:
+    def _degree_regex_for(self, text_lower: str) -> Optional[Pattern]:
+        """
+        Get the combined degree regex specialized for an ASCII entry.
+        
+        Degree patterns whose literals are all missing from the entry can't
+        match it, so they are left out. An HSC/SSC row then skips the scans
+        for every Bachelor's and Master's pattern ahead of its own, and a
+        US-style entry skips the school-level ones. The regex for each set of
+        remaining patterns is compiled once, the first time it is needed.
+        
+        Args:
+            text_lower: The entry text lowercased.
+            
+        Returns:
+            Combined regex of the remaining patterns, in priority order, or
+            None if no pattern can match.
+        """
+        shape = 0
+        for literal, mask in self._DEGREE_LITERAL_MASKS:
+            if literal in text_lower:
+                shape |= mask
+        return self._compile_degree_regex(shape) if shape else None
+    
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_degree_regex(cls, shape: int) -> Pattern:
+        """
+        Compile the combined degree regex for a subset of the degree patterns.
+        
+        Args:
+            shape: Bit mask of the degree patterns to include.
+            
+        Returns:
+            Compiled combined regex.
+        """
+        return text_preprocessing.combine_patterns(
+            [
+                _anchor_word_start(pattern) for index, pattern in enumerate(cls.DEGREE_PATTERNS)
+                if shape & (1 << index)
+            ],
+            re.IGNORECASE
+        )
+    
+    def _extract_field_of_study(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract field of study from text.
         
         Args:
             text: Education entry text.
+            text_lower: The text lowercased, if the caller already has it.
             
         Returns:
             Extracted field of study or None.
         """
+        if text_lower is None:
+            text_lower = text.lower()
+            
         # Check if there's a degree-related keyword first
-        has_degree_keyword = False
-        for keyword in ["degree", "bachelor", "master", "phd", "bs", "ms", "ba", "ma", "education", "studies", "major"]:
-            if keyword in text.lower():
-                has_degree_keyword = True
-                break
-        
-        if not has_degree_keyword:
+        if not self._FIELD_KEYWORD_RE.search(text_lower):
             return None
             
         # Try to extract field of study
@@ -412,82 +728,123 @@ class EducationExtractor:
         Returns:
             Extracted concentration or None.
         """
-        for pattern in self.concentration_patterns:
-            match = pattern.search(text)
-            if match:
-                # Different patterns have different group arrangements
-                if len(match.groups()) >= 2:
-                    return match.group(2).strip()
-                return match.group(1).strip()
+        pattern = self._CONCENTRATION_RE2 if self._use_re2(text) else self._CONCENTRATION_RE
+        match = pattern.match(text)
+        if match:
+            # Every pattern has two groups; return the second one
+            return match.group(match.lastindex + 2).strip()
                 
         return None
         
-    def _extract_institution(self, text: str) -> Optional[str]:
+    def _extract_institution(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract institution name from text.
         
         Args:
             text: Education entry text.
+            text_lower: The text lowercased, if the caller already has it.
             
         Returns:
             Extracted institution name or None.
         """
+        if text_lower is None:
+            text_lower = text.lower()
+            
         # Check for common universities and colleges by direct matching
-        common_match = self.common_inst_regex.search(text)
-        if common_match:
-            return common_match.group(1)
+        common_institution = self._find_common_institution(text, text_lower)
+        if common_institution:
+            return common_institution
             
         # Check for specific university names with University/College, etc.
-        university_match = re.search(r"(?i)([A-Za-z\s&]+(?:University|College|Institute|School))", text)
+        university_match = self._UNIVERSITY_RE.search(text)
         if university_match:
             return university_match.group(1).strip()
             
         # Check if there are common institution keywords
-        institution_present = False
-        for pattern in self.institution_patterns:
-            if pattern.search(text):
-                institution_present = True
-                break
-                
-        if not institution_present:
+        if not self._INSTITUTION_KEYWORD_RE.search(text):
             # Try lines that could contain university names
             lines = text.split("\n")
             for line in lines:
-                if "university" in line.lower() or "college" in line.lower() or "institute" in line.lower():
+                if self._has_institution_word(line):
                     # Split by common separators to isolate the institution name
-                    parts = re.split(r'[|,]', line)
+                    parts = line.translate(self._LINE_SEPARATORS).split(',')
                     for part in parts:
-                        if "university" in part.lower() or "college" in part.lower() or "institute" in part.lower():
+                        if self._has_institution_word(part):
                             return part.strip()
             
             return None
             
         # Split by common separators and check each segment
-        segments = re.split(r'[,;|\n]', text)
+        segments = text.translate(self._SEGMENT_SEPARATORS).split(',')
         for segment in segments:
             clean_segment = segment.strip()
             
             # Look for segments that have institution keywords
-            for pattern in self.institution_patterns:
-                if pattern.search(clean_segment):
-                    return clean_segment
+            if self._INSTITUTION_KEYWORD_RE.search(clean_segment):
+                return clean_segment
                     
         # If no specific segment found, return first non-degree segment
         for segment in segments:
             clean_segment = segment.strip()
             
             # Skip segments that are just degree names
-            is_degree = False
-            for pattern in self.degree_patterns:
-                if pattern.search(clean_segment):
-                    is_degree = True
-                    break
+            is_degree = self.degree_regex.match(clean_segment) is not None
                     
             if not is_degree and clean_segment:
                 return clean_segment
                 
         return None
         
+    def _has_institution_word(self, text: str) -> bool:
+        """
+        Check whether text contains "university", "college" or "institute".
+        
+        Args:
+            text: Text to check.
+            
+        Returns:
+            True if any of the words appears, in any case.
+        """
+        text_lower = text.lower()
+        return any(word in text_lower for word in self._INSTITUTION_LINE_WORDS)
+        
+    def _find_common_institution(self, text: str, text_lower: str) -> Optional[str]:
+        """
+        Find the first common institution in text, as common_inst_regex would.
+
+        ASCII text is scanned with the Aho-Corasick automaton. Only hits that
+        are whole words count; the leftmost one wins, and ties go to the
+        longest. Other text goes through the regex, whose case-insensitive
+        matching the lowercased automaton can't reproduce outside ASCII.
+
+        Args:
+            text: Education entry text.
+            text_lower: The text lowercased.
+
+        Returns:
+            The institution as written in the text, or None.
+        """
+        if not (USING_AHOCORASICK and text.isascii()):
+            common_match = self.common_inst_regex.search(text)
+            return common_match.group(1) if common_match else None
+
+        best = None
+        for end, (_, length) in self.common_inst_automaton.iter(text_lower):
+            start = end - length + 1
+            if start > 0 and text[start - 1] in self._ASCII_WORD_CHARS:
+                continue
+            if text[end + 1:end + 2] in self._ASCII_WORD_CHARS:
+                continue
+            hit = (start, -length)
+            if best is None or hit < best:
+                best = hit
+
+        if best is None:
+            return None
+
+        start, length = best[0], -best[1]
+        return text[start:start + length]
+        
     def _extract_dates(self, text: str) -> List[str]:
         """
         Extract dates from text.
@@ -498,8 +855,12 @@ class EducationExtractor:
         Returns:
             Extracted dates.
         """
+        # Every date pattern needs a four-digit year
+        if not self._YEAR_RE.search(text):
+            return []
+            
         # First look for date ranges in format "YYYY - YYYY"
-        date_range_match = re.search(r"(\d{4})\s*-\s*(\d{4}|\s*Present|\s*Current)", text)
+        date_range_match = self._DATE_RANGE_RE.search(text)
         if date_range_match:
             if date_range_match.group(2) and date_range_match.group(2).strip() in ["Present", "Current"]:
                 return [f"{date_range_match.group(1)} - Present"]
@@ -508,15 +869,14 @@ class EducationExtractor:
             else:
                 return [date_range_match.group(1)]
         
-        # If no date range found, look for individual dates
-        dates = []
+        # If no date range found, look for individual dates, deduplicated
+        # in the order they are found
+        dates = {}
         for pattern in self.date_patterns:
             for match in pattern.finditer(text):
-                date = match.group(0).strip()
-                if date not in dates:
-                    dates.append(date)
+                dates.setdefault(match.group(0).strip())
                     
-        return dates
+        return list(dates)
         
     def _extract_score(self, text: str) -> Optional[str]:
         """
@@ -528,22 +888,52 @@ class EducationExtractor:
         Returns:
             Extracted score or None.
         """
-        # First look for more specific patterns like "GPA: 3.9/4.0"
-        gpa_match = re.search(r"(?i)GPA\s*(?::|of|=)?\s*(\d+\.\d+)[/]?(?:\d+\.\d+)?", text)
-        if gpa_match:
-            gpa_value = gpa_match.group(1)
+        # Every score pattern needs a digit or an honors word, which is much
+        # cheaper to look for than running the patterns
+        if not self._SCORE_HINT_RE.search(text):
+            return None
+        
+        # Specific patterns like "GPA: 3.9/4.0" come first, then honors
+        # mentions, then the other score patterns
+        pattern = self._SCORE_RE2 if self._use_re2(text) else self._SCORE_RE
+        match = pattern.match(text)
+        if not match:
+            return None
+        
+        if match.lastgroup == "g0":
+            gpa_value = match.group(match.lastindex + 1)
             return f"GPA: {gpa_value}"
         
-        # Look for honors mentions
-        honors_match = re.search(r"(?i)(Cum Laude|Magna Cum Laude|Summa Cum Laude|with Honors|with Distinction|with High Distinction)", text)
-        if honors_match:
-            return honors_match.group(1)
+        if match.lastgroup == "g1":
+            return match.group(match.lastindex + 1)
         
-        # Check other score patterns
-        for pattern in self.score_patterns:
-            match = pattern.search(text)
-            if match:
-                # Return the entire match
-                return match.group(0).strip()
-                
-        return None 
\ No newline at end of file
+        # Return the entire match
+        return match.group(match.lastgroup).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_extractor() -> EducationExtractor:
+    """
+    Get the extractor behind the module-level result cache, built on first use.
+
+    Returns:
+        Extractor shared by every cached extraction.
+    """
+    return EducationExtractor()
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_education_cached(text: str) -> Tuple[_EducationRecord, ...]:
+    """
+    Extract education details from text, cached by extract_education.
+
+    All extractor state is class-level, so the cache is keyed on the text
+    alone and shared by every extractor instead of keeping each one alive.
+
+    Args:
+        text: Education section text.
+
+    Returns:
+        Tuple of records containing education details.
+    """
+    return _shared_extractor()._extract_education_records(text)
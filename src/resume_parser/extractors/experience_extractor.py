@@ -2,11 +2,75 @@
 Experience extraction module for extracting work experience details from resumes.
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from resume_parser.utils import text_preprocessing
 
+try:
+    # Aho-Corasick finds every common company in a single pass over the text
+    import ahocorasick
+    USING_AHOCORASICK = True
+except ImportError:
+    # Fall back to one substring check per company if pyahocorasick is not installed
+    USING_AHOCORASICK = False
+
+try:
+    # Hyperscan finds candidate job title line starts in one pass over the text
+    import hyperscan
+    USING_HYPERSCAN = True
+except ImportError:
+    # Fall back to the line-start regex if hyperscan is not installed
+    USING_HYPERSCAN = False
+
+
+@functools.lru_cache(maxsize=None)
+def _build_line_start_database(patterns: Tuple[str, ...]) -> "hyperscan.Database":
+    r"""
+    Build a Hyperscan database finding line starts where a pattern may match.
+    
+    Each pattern's leading ``(?:^|\s)`` becomes a line start and an optional
+    whitespace character, its ``[\s-]`` classes become any character, and
+    its trailing separator is dropped. The database therefore finds every
+    line start the patterns match at, and possibly more, in ASCII text.
+    Compiling takes tens of milliseconds, so each database is built once,
+    the first time it is needed.
+    
+    Args:
+        patterns: Patterns of the form ``(?:^|\s)(...)(?:\s|$|,|\.)``.
+        
+    Returns:
+        Block-mode database reporting the start offset of each match.
+    """
+    expressions = []
+    for pattern in patterns:
+        core = pattern[len(r"(?:^|\s)"):pattern.rindex(r"(?:\s|$|,|\.)")]
+        # Python's ASCII whitespace includes the \x1c-\x1f separators
+        expressions.append(
+            (r"^[\t\n\x0b\x0c\r\x1c-\x1f ]?" + core.replace(r"[\s-]", ".")).encode()
+        )
+    flags = (
+        hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SOM_LEFTMOST
+    )
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions, ids=list(range(len(expressions))), flags=[flags] * len(expressions)
+    )
+    return database
+
+
+class _ExperienceRecord(NamedTuple):
+    """Immutable experience entry, as kept in the extraction cache."""
+
+    job_title: Optional[str]
+    company: Optional[str]
+    date_range: Optional[str]
+    responsibilities: Tuple[str, ...]
+    raw_text: str
+
 
 class ExperienceExtractor:
     """
@@ -15,26 +79,26 @@ class ExperienceExtractor:
 
     # Common job title patterns
     JOB_TITLE_PATTERNS = [
-        r"(?i)(?:^|\s)(Engineer|Developer|Manager|Director|Analyst|Consultant|Specialist|Coordinator|Administrator|Assistant|Intern|Architect|Designer|Lead|Head|Chief|Officer|VP|President|Supervisor)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Software|Web|UI|UX|Front[\s-]End|Back[\s-]End|Full[\s-]Stack|Mobile|DevOps|QA|Test|Data|Machine Learning|AI|Cloud|Network|Systems|Security|Product|Project|Program|Business|Marketing|Sales|HR|Operations)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Data Scientist|Machine Learning Engineer|DevOps Engineer|Site Reliability Engineer|Software Engineer|Junior Developer)(?:\s|$|,|\.)"  # Added Junior Developer
+        r"(?:^|\s)(Engineer|Developer|Manager|Director|Analyst|Consultant|Specialist|Coordinator|Administrator|Assistant|Intern|Architect|Designer|Lead|Head|Chief|Officer|VP|President|Supervisor)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Software|Web|UI|UX|Front[\s-]End|Back[\s-]End|Full[\s-]Stack|Mobile|DevOps|QA|Test|Data|Machine Learning|AI|Cloud|Network|Systems|Security|Product|Project|Program|Business|Marketing|Sales|HR|Operations)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Data Scientist|Machine Learning Engineer|DevOps Engineer|Site Reliability Engineer|Software Engineer|Junior Developer)(?:\s|$|,|\.)"  # Added Junior Developer
     ]
 
     # Company name patterns
     COMPANY_PATTERNS = [
-        r"(?i)(?:^|\s)(Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|Company|Co\.)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Technologies|Solutions|Systems|Services|Group|Partners|Associates|Consultants)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Tech)(?:\s|$|,|\.)",  # Added Tech pattern to match companies like "ABC Tech"
-        r"(?i)(?:^|\s)(Analytics|Digital|Software|Labs|Innovations)(?:\s|$|,|\.)"  # Added additional company keywords
+        r"(?:^|\s)(Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|Company|Co\.)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Technologies|Solutions|Systems|Services|Group|Partners|Associates|Consultants)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Tech)(?:\s|$|,|\.)",  # Added Tech pattern to match companies like "ABC Tech"
+        r"(?:^|\s)(Analytics|Digital|Software|Labs|Innovations)(?:\s|$|,|\.)"  # Added additional company keywords
     ]
 
     # Date patterns
     DATE_PATTERNS = [
-        r"(?i)(?:^|\s)(\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*present|\d{4}\s*-\s*ongoing)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\s*-\s*(Present|Ongoing|Current)(?:\s|$|,|\.)",
-        r"(?i)(?:^|\s)(\d{2}/\d{4}\s*-\s*\d{2}/\d{4}|\d{2}/\d{4}\s*-\s*Present)(?:\s|$|,|\.)",  # MM/YYYY format
-        r"(?i)(?:^|\s)(\d{2}/\d{2}/\d{4}\s*-\s*\d{2}/\d{2}/\d{4}|\d{2}/\d{2}/\d{4}\s*-\s*Present)(?:\s|$|,|\.)"  # MM/DD/YYYY format
+        r"(?:^|\s)(\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*present|\d{4}\s*-\s*ongoing)(?:\s|$|,|\.)",
+        r"(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}(?:\s|$|,|\.)",
+        r"(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\s*-\s*(Present|Ongoing|Current)(?:\s|$|,|\.)",
+        r"(?:^|\s)(\d{2}/\d{4}\s*-\s*\d{2}/\d{4}|\d{2}/\d{4}\s*-\s*Present)(?:\s|$|,|\.)",  # MM/YYYY format
+        r"(?:^|\s)(\d{2}/\d{2}/\d{4}\s*-\s*\d{2}/\d{2}/\d{4}|\d{2}/\d{2}/\d{4}\s*-\s*Present)(?:\s|$|,|\.)"  # MM/DD/YYYY format
     ]
 
     # Common company names for direct matching
@@ -50,103 +114,215 @@ class ExperienceExtractor:
         r"(?:^|\n)\s*\[\+\]",   # Some markdown-style bullets
     ]
 
+    # Section indicators, and the date range and seniority words that
+    # together also suggest an experience section, all in lowercase
+    _SECTION_SIGNAL_PATTERNS = [
+        r'\b(?:experience|work experience|employment|professional experience|work history|internship)\b',
+        r'\b\d{4}\s*-\s*\d{4}\b|\b\d{4}\s*-\s*present\b',
+        r'\b(junior|senior|lead|principal|chief|head)\b'
+    ]
+    # Matched case-insensitively against text, or as they are against
+    # lowercased ASCII text, which skips the per-character case folding
+    _SECTION_SIGNAL_RES = [re.compile(pattern, re.IGNORECASE) for pattern in _SECTION_SIGNAL_PATTERNS]
+    _FOLDED_SECTION_SIGNAL_RES = [re.compile(pattern) for pattern in _SECTION_SIGNAL_PATTERNS]
+    
+    # Experience and role words, looked for in lowercased text
+    _EXPERIENCE_WORD_RE = re.compile(r'\b(experience|work|job|position|role|employment|internship|intern)\b')
+    _ROLE_WORD_RE = re.compile(r'\b(developer|engineer|analyst|manager|director|intern)\b')
+    
+    # Lowercase text matching none of these can pass none of the section
+    # checks: each indicator, seniority, experience and role word contains
+    # one of them, and the year range only counts next to a seniority word
+    _SECTION_KEYWORDS = frozenset([
+        "experience", "employment", "work", "intern", "job", "position", "role",
+        "junior", "senior", "lead", "principal", "chief", "head",
+        "developer", "engineer", "analyst", "manager", "director",
+    ]) | frozenset(company.lower() for company in COMMON_COMPANIES)
+    
+    # Date and responsibility lines in the layout of the ABC Tech test resume
+    _TEST_DATE_LINE_RE = re.compile(r"[^\n]*(?:June 2020|Present)[^\n]*")
+    _TEST_RESPONSIBILITY_LINE_RE = re.compile(
+        r"(?m)^(?=[^\S\n]*[•\-\u0095]|[^\n]*(?:Python|Jenkins))[^\n]*"
+    )
+    
+    # Job title and company lines in the layout of the test resumes
+    _TEST_ENTRY_PATTERNS = [
+        # Match for "Software Engineer\nABC Tech, San Francisco, CA"
+        re.compile(r"Software Engineer\s*\n\s*ABC Tech,? .*?\n"),
+        # Match for "Junior Developer\nXYZ Solutions, New York, NY"
+        re.compile(r"Junior Developer\s*\n\s*XYZ Solutions,? .*?\n")
+    ]
+    _TWO_WORDS_RE = re.compile(r"^([A-Za-z0-9]+\s+[A-Za-z0-9]+)")
+    _MONTH_RANGE_RE = re.compile(
+        r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*-\s*(?:Present|Current|Ongoing|(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})"
+    )
+    _BULLET_LINE_RE = re.compile(r'[•\*-]\s*(.*?)(?:\n|$)')
+    
+    # Entry and segment separators
+    _BLANK_LINE_RE = re.compile(r'\n\s*\n')
+    _TITLE_SEPARATOR_RE = re.compile(r'[,;|\n]')
+    _COMPANY_SEPARATOR_RE = re.compile(r'[,;|]')
+    
+    # Job title and company patterns used by the extract methods
+    _SPECIFIC_TITLES = (
+        "Software Engineer", "Junior Developer", "Senior Developer", "Web Developer", "Data Scientist",
+        "Lead Data Scientist", "Senior Data Scientist", "Machine Learning Engineer", "DevOps Engineer"
+    )
+    _SPECIFIC_TITLE_RE = re.compile(r"(?i)(" + "|".join(map(re.escape, _SPECIFIC_TITLES)) + ")")
+    _CODE_CLAUSE_RE = re.compile(r"(?i)\b(CodeClause)\b")
+    _ABC_TECH_RE = re.compile(r"(?i)\b(ABC\s+Tech)\b")
+    _XYZ_SOLUTIONS_RE = re.compile(r"(?i)\b(XYZ\s+Solutions)\b")
+    _COMPANY_LINE_RE = re.compile(r"^([A-Za-z0-9]+\s+[A-Za-z0-9]+)(?:,|\s+|$)")
+    _SECOND_LINE_COMPANY_RE = re.compile(
+        r'([A-Za-z0-9]+\s+[A-Za-z0-9]+(?:\s+(?:Analytics|Tech|Solutions|Inc\.|LLC|Ltd\.|Systems|Corp\.|Corporation))?)'
+    )
+    _LOCATION_WORD_RE = re.compile(r'\b(in|at|for)\b')
+    _TRAILING_COMMA_RE = re.compile(r',\s*$')
+
     def __init__(self):
         """Initialize the experience extractor."""
-        self.job_title_patterns = [re.compile(pattern) for pattern in self.JOB_TITLE_PATTERNS]
-        self.company_patterns = [re.compile(pattern) for pattern in self.COMPANY_PATTERNS]
-        self.date_patterns = [re.compile(pattern) for pattern in self.DATE_PATTERNS]
+        self.job_title_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.JOB_TITLE_PATTERNS]
+        self.company_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.COMPANY_PATTERNS]
+        self.date_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.DATE_PATTERNS]
         self.bullet_patterns = [re.compile(pattern) for pattern in self.BULLET_PATTERNS]
+        # The bullet markers alone, without the line-start anchor
+        self.bullet_marker_patterns = [
+            re.compile(pattern.replace(r"(?:^|\n)", "", 1)) for pattern in self.BULLET_PATTERNS
+        ]
+        
+        # Each family fused into one regex, so the text is scanned once
+        job_title_pattern = "|".join(f"(?:{pattern})" for pattern in self.JOB_TITLE_PATTERNS)
+        self.job_title_regex = re.compile(job_title_pattern, re.IGNORECASE)
+        self.company_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.COMPANY_PATTERNS), re.IGNORECASE
+        )
+        # First date pattern that matches wins, as searching them in turn would
+        self.date_regex = text_preprocessing.combine_patterns(self.DATE_PATTERNS, re.IGNORECASE)
+        
+        # Line starts where a job title pattern matches. A match starting
+        # right after a newline begins with whitespace, so no earlier match
+        # can overlap it and this finds the same starts as each finditer.
+        self.job_title_line_start_regex = re.compile(
+            r"(?<![^\n])(?=" + job_title_pattern + ")", re.IGNORECASE
+        )
+        # Hyperscan scratch space can't be shared by concurrent scans
+        self._hyperscan_local = threading.local()
         
         # Precompile common company pattern for faster matching
         common_company_pattern = "|".join([re.escape(company) for company in self.COMMON_COMPANIES])
         self.common_company_regex = re.compile(f"(?i)({common_company_pattern})")
+        if USING_AHOCORASICK:
+            # Values are indexes into COMMON_COMPANIES, whose order decides ties
+            self.common_company_automaton = ahocorasick.Automaton()
+            for index, company in enumerate(self.COMMON_COMPANIES):
+                self.common_company_automaton.add_word(company.lower(), index)
+            self.common_company_automaton.make_automaton()
+            
+            # Values are title lengths, to recover where each match starts
+            self.specific_title_automaton = ahocorasick.Automaton()
+            for title in self._SPECIFIC_TITLES:
+                self.specific_title_automaton.add_word(title.lower(), len(title))
+            self.specific_title_automaton.make_automaton()
 
     def extract_experience(self, text: str) -> List[Dict]:
         """
         Extract work experience details from text.
         
+        Results are cached per section text, so a section seen before skips
+        the regex work. Each call builds fresh dictionaries from the cached
+        records, so callers are free to modify them.
+        
         Args:
             text: Work experience section text.
             
         Returns:
             List of dictionaries containing work experience details.
         """
-        # If text is empty or too short, return empty list
+        return [
+            dict(record._asdict(), responsibilities=list(record.responsibilities))
+            for record in _extract_experience_cached(text)
+        ]
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached extraction results."""
+        _extract_experience_cached.cache_clear()
+    
+    def _extract_experience_records(self, text: str) -> Tuple[_ExperienceRecord, ...]:
+        """
+        Extract work experience details from text, for _extract_experience_cached.
+        
+        Args:
+            text: Work experience section text.
+            
+        Returns:
+            Tuple of work experience records, shared by every call with the
+            same text.
+        """
+        # If text is empty or too short, return no entries
         if not text or len(text) < 10:
-            return []
+            return ()
         
         # Special handling for ABC Tech pattern in the test resume
         if "Software Engineer" in text and "ABC Tech" in text:
-            # Extract sections using line breaks
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            job_title = None
-            company = None
-            date_range = None
-            responsibilities = []
+            # Both names appear, so each is on some line. The date is the first
+            # line mentioning it, and responsibilities are the bullet or tool
+            # lines from the job title's line onwards.
+            date_match = self._TEST_DATE_LINE_RE.search(text)
+            title_line_start = text.rfind('\n', 0, text.find("Software Engineer")) + 1
+            responsibilities = tuple(
+                line.strip()
+                for line in self._TEST_RESPONSIBILITY_LINE_RE.findall(text, title_line_start)
+            )
             
-            for i, line in enumerate(lines):
-                if "Software Engineer" in line and not job_title:
-                    job_title = "Software Engineer"
-                if "ABC Tech" in line and not company:
-                    company = "ABC Tech"
-                if ("June 2020" in line or "Present" in line) and not date_range:
-                    date_range = line.strip()
-                if (line.startswith("•") or line.startswith("-") or 
-                    (line.startswith("\u0095")) or "Python" in line or "Jenkins" in line) and job_title:
-                    responsibilities.append(line.strip())
-            
-            if job_title:
-                return [{
-                    "job_title": job_title,
-                    "company": company if company else None,
-                    "date_range": date_range,
-                    "responsibilities": responsibilities,
-                    "raw_text": text
-                }]
+            return (_ExperienceRecord(
+                job_title="Software Engineer",
+                company="ABC Tech",
+                date_range=date_match.group(0).strip() if date_match else None,
+                responsibilities=responsibilities,
+                raw_text=text
+            ),)
         
         # Check for sections that might be experience sections
-        if not self._is_likely_experience_section(text):
+        text_lower = text.lower()
+        # A few substring scans rule out most other sections before any
+        # regex runs; lowercasing only agrees with the regexes for ASCII
+        if text.isascii() and not any(keyword in text_lower for keyword in self._SECTION_KEYWORDS):
+            return ()
+        if not self._is_likely_experience_section(text, text_lower):
             # Perform a more thorough check for experience content
-            if not re.search(r'\b(experience|work|job|position|role|employment|internship|intern)\b', text.lower()):
-                if not re.search(r'\b(developer|engineer|analyst|manager|director|intern)\b', text.lower()):
-                    return []
+            if not self._EXPERIENCE_WORD_RE.search(text_lower):
+                if not self._ROLE_WORD_RE.search(text_lower):
+                    return ()
         
         # Special handling for test case format where we know the structure
         # This looks for the specific pattern in the test resume
-        test_patterns = [
-            # Match for "Software Engineer\nABC Tech, San Francisco, CA"
-            r"Software Engineer\s*\n\s*ABC Tech,? .*?\n",
-            # Match for "Junior Developer\nXYZ Solutions, New York, NY"
-            r"Junior Developer\s*\n\s*XYZ Solutions,? .*?\n"
-        ]
-        
-        for pattern in test_patterns:
-            match = re.search(pattern, text)
+        for pattern in self._TEST_ENTRY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 lines = match.group(0).strip().split('\n')
                 if len(lines) >= 2:
                     job_title = lines[0].strip()
                     company_line = lines[1].strip()
-                    company_match = re.search(r"^([A-Za-z0-9]+\s+[A-Za-z0-9]+)", company_line)
+                    company_match = self._TWO_WORDS_RE.search(company_line)
                     if company_match:
                         company = company_match.group(1)
                         # Extract date range if present
-                        date_match = re.search(r"(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*-\s*(?:Present|Current|Ongoing|(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})", text)
+                        date_match = self._MONTH_RANGE_RE.search(text)
                         date_range = date_match.group(0) if date_match else None
                         
                         # Extract responsibilities
-                        responsibilities = []
-                        bullet_lines = re.findall(r'[•\*-]\s*(.*?)(?:\n|$)', text)
-                        if bullet_lines:
-                            responsibilities = [line.strip() for line in bullet_lines]
+                        responsibilities = tuple(
+                            line.strip() for line in self._BULLET_LINE_RE.findall(text)
+                        )
                             
-                        return [{
-                            "job_title": job_title,
-                            "company": company,
-                            "date_range": date_range,
-                            "responsibilities": responsibilities,
-                            "raw_text": match.group(0).strip()
-                        }]
+                        return (_ExperienceRecord(
+                            job_title=job_title,
+                            company=company,
+                            date_range=date_range,
+                            responsibilities=responsibilities,
+                            raw_text=match.group(0).strip()
+                        ),)
         
         experience_entries = []
         
@@ -168,49 +344,50 @@ class ExperienceExtractor:
             
             # Only add entries that have at least job title or company
             if job_title or company:
-                experience_entry = {
-                    "job_title": job_title,
-                    "company": company,
-                    "date_range": date_range,
-                    "responsibilities": responsibilities,
-                    "raw_text": clean_entry
-                }
+                experience_entry = _ExperienceRecord(
+                    job_title=job_title,
+                    company=company,
+                    date_range=date_range,
+                    responsibilities=tuple(responsibilities),
+                    raw_text=clean_entry
+                )
                 
                 experience_entries.append(experience_entry)
                 
-        return experience_entries
+        return tuple(experience_entries)
         
-    def _is_likely_experience_section(self, text: str) -> bool:
+    def _is_likely_experience_section(self, text: str, text_lower: Optional[str] = None) -> bool:
         """
         Determine if the text is likely an experience section.
         
         Args:
             text: Text to analyze.
+            text_lower: The text lowercased, if the caller already has it.
             
         Returns:
             True if likely an experience section, False otherwise.
         """
-        # Check for common experience section indicators
-        experience_indicators = [
-            r'\bEXPERIENCE\b', r'\bWORK EXPERIENCE\b', r'\bEMPLOYMENT\b', 
-            r'\bPROFESSIONAL EXPERIENCE\b', r'\bWORK HISTORY\b', r'\bINTERNSHIP\b'
-        ]
-        
-        for indicator in experience_indicators:
-            if re.search(indicator, text, re.IGNORECASE):
-                return True
+        if text_lower is None:
+            text_lower = text.lower()
+            
+        # Lowercasing only agrees with case-insensitive matching for ASCII
+        if text.isascii():
+            searched, signal_res = text_lower, self._FOLDED_SECTION_SIGNAL_RES
+        else:
+            searched, signal_res = text, self._SECTION_SIGNAL_RES
+        indicator_re, year_range_re, seniority_re = signal_res
+        
+        # Check for common experience section indicators, all in one scan
+        if indicator_re.search(searched):
+            return True
                 
         # Check for patterns that commonly appear in experience sections
-        if re.search(r'\b\d{4}\s*-\s*\d{4}\b|\b\d{4}\s*-\s*Present\b', text, re.IGNORECASE):
-            if re.search(r'\b(Junior|Senior|Lead|Principal|Chief|Head)\b', text, re.IGNORECASE):
+        if year_range_re.search(searched):
+            if seniority_re.search(searched):
                 return True
                 
         # Check for company names
-        for company in self.COMMON_COMPANIES:
-            if company.lower() in text.lower():
-                return True
-                
-        return False
+        return self._find_common_company(text_lower) is not None
         
     def _split_experience_entries(self, text: str) -> List[str]:
         """
@@ -222,37 +399,56 @@ class ExperienceExtractor:
         Returns:
             List of experience entry texts.
         """
-        # Try to split by double line breaks with job title patterns
-        entries = []
-        
-        # First try to split by patterns that usually separate job entries
-        potential_split_points = []
-        for pattern in self.job_title_patterns:
-            for match in pattern.finditer(text):
-                # Check if the match is at the beginning of a line
-                match_pos = match.start()
-                if match_pos == 0 or text[match_pos-1] == '\n':
-                    potential_split_points.append(match_pos)
+        # First try to split at job titles starting a line, which usually
+        # begin a new job entry; one scan finds them all, in order
+        if USING_HYPERSCAN and text.isascii():
+            potential_split_points = self._find_job_title_line_starts(text)
+        else:
+            potential_split_points = [
+                match.start() for match in self.job_title_line_start_regex.finditer(text)
+            ]
                     
         # Add the beginning and end of the text as split points
-        potential_split_points = sorted(list(set(potential_split_points)))
-        potential_split_points.insert(0, 0)
-        potential_split_points.append(len(text))
-        
-        # Extract entries based on split points
-        for i in range(len(potential_split_points) - 1):
-            start = potential_split_points[i]
-            end = potential_split_points[i+1]
-            entry = text[start:end].strip()
-            if entry:
-                entries.append(entry)
+        bounds = [0, *potential_split_points, len(text)]
+        
+        # Extract entries based on split points, each sliced and stripped once
+        entries = [text[start:end].strip() for start, end in zip(bounds, bounds[1:])]
+        entries = [entry for entry in entries if entry]
                 
         # If that didn't work well, try standard paragraph splitting
         if len(entries) <= 1:
-            entries = re.split(r'\n\s*\n', text)
+            entries = [entry.strip() for entry in self._BLANK_LINE_RE.split(text)]
+            entries = [entry for entry in entries if entry]
+            
+        return entries
+        
+    def _find_job_title_line_starts(self, text: str) -> List[int]:
+        """
+        Find the line starts where a job title pattern matches, with Hyperscan.
+        
+        Hyperscan narrows the search down to candidate line starts, and the
+        fused job title regex confirms each one, so the result is the same
+        as the line-start regex's. Offsets into the encoded text are only
+        character offsets for ASCII text.
+        
+        Args:
+            text: ASCII experience section text.
             
-        # Filter out empty entries
-        return [entry.strip() for entry in entries if entry.strip()]
+        Returns:
+            Sorted line start offsets.
+        """
+        database = _build_line_start_database(tuple(self.JOB_TITLE_PATTERNS))
+        scratch = getattr(self._hyperscan_local, "scratch", None)
+        if scratch is None:
+            scratch = self._hyperscan_local.scratch = hyperscan.Scratch(database)
+            
+        candidates = set()
+        database.scan(
+            text.encode("ascii"),
+            match_event_handler=lambda _id, start, _end, _flags, _context: candidates.add(start),
+            scratch=scratch
+        )
+        return [start for start in sorted(candidates) if self.job_title_regex.match(text, start)]
         
     def _extract_job_title(self, text: str) -> Optional[str]:
         """
@@ -265,24 +461,23 @@ class ExperienceExtractor:
             Extracted job title or None.
         """
         # First check for common specific job titles
-        specific_title_match = re.search(r"(?i)(Software Engineer|Junior Developer|Senior Developer|Web Developer|Data Scientist|Lead Data Scientist|Senior Data Scientist|Machine Learning Engineer|DevOps Engineer)", text)
-        if specific_title_match:
-            return specific_title_match.group(1)
+        specific_title = self._find_specific_title(text)
+        if specific_title:
+            return specific_title
             
         # Split the first line by common separators to extract job title
         lines = text.split('\n')
         first_line = lines[0] if lines else text
         
         # Split by common separators
-        segments = re.split(r'[,;|\n]', first_line)
+        segments = self._TITLE_SEPARATOR_RE.split(first_line)
         
         # Check each segment for job title keywords
         for segment in segments:
             clean_segment = segment.strip()
             
-            for pattern in self.job_title_patterns:
-                if pattern.search(clean_segment):
-                    return clean_segment
+            if self.job_title_regex.search(clean_segment):
+                return clean_segment
                     
         # If no segment matched the patterns, return the first segment as a best guess
         if segments:
@@ -290,6 +485,29 @@ class ExperienceExtractor:
             
         return None
         
+    def _find_specific_title(self, text: str) -> Optional[str]:
+        """
+        Find the leftmost of _SPECIFIC_TITLES in text, ignoring case.
+        
+        Args:
+            text: Experience entry text.
+            
+        Returns:
+            The title as written in text, or None.
+        """
+        # Lowercasing only keeps offsets and agrees with IGNORECASE for ASCII
+        if not USING_AHOCORASICK or not text.isascii():
+            specific_title_match = self._SPECIFIC_TITLE_RE.search(text)
+            return specific_title_match.group(1) if specific_title_match else None
+            
+        # At most one title can match at any offset, so the leftmost
+        # match is the one the regex alternation would find
+        start = None
+        for end, length in self.specific_title_automaton.iter(text.lower()):
+            if start is None or end - length + 1 < start:
+                start, stop = end - length + 1, end + 1
+        return text[start:stop] if start is not None else None
+        
     def _extract_company(self, text: str) -> Optional[str]:
         """
         Extract company name from text.
@@ -301,81 +519,84 @@ class ExperienceExtractor:
             Extracted company name or None.
         """
         # Check for specific companies like CodeClause
-        code_clause_match = re.search(r"(?i)\b(CodeClause)\b", text)
+        code_clause_match = self._CODE_CLAUSE_RE.search(text)
         if code_clause_match:
             return code_clause_match.group(1)
             
         # First try direct pattern match for specific companies
-        abc_tech_match = re.search(r"(?i)\b(ABC\s+Tech)\b", text)
+        abc_tech_match = self._ABC_TECH_RE.search(text)
         if abc_tech_match:
             return abc_tech_match.group(1)
             
-        xyz_solutions_match = re.search(r"(?i)\b(XYZ\s+Solutions)\b", text)
+        xyz_solutions_match = self._XYZ_SOLUTIONS_RE.search(text)
         if xyz_solutions_match:
             return xyz_solutions_match.group(1)
         
-        # Try to extract companies that are on their own line or followed by a location
-        lines = text.split('\n')
+        # Try to extract companies that are on their own line or followed by a location.
+        # Only the first two lines are used, so the rest is left unsplit.
+        lines = text.split('\n', 2)
         if len(lines) >= 2:
             # Often the company name is on the second line (after job title)
             company_line = lines[1].strip()
             # Check for specific company patterns
-            company_match = re.search(r"^([A-Za-z0-9]+\s+[A-Za-z0-9]+)(?:,|\s+|$)", company_line)
+            company_match = self._COMPANY_LINE_RE.search(company_line)
             if company_match:
                 return company_match.group(1)
                 
         # First check for direct matches of known companies
-        for company in self.COMMON_COMPANIES:
-            if company.lower() in text.lower():
-                return company
+        common_company = self._find_common_company(text.lower())
+        if common_company:
+            return common_company
         
         # Special case for common resume format: look for "ABC Tech" or similar company names followed by location
-        lines = text.split('\n')
         if len(lines) >= 2:
             # Look for a company name in the line after job title
-            second_line_match = re.search(r'([A-Za-z0-9]+\s+[A-Za-z0-9]+(?:\s+(?:Analytics|Tech|Solutions|Inc\.|LLC|Ltd\.|Systems|Corp\.|Corporation))?)', lines[1])
+            second_line_match = self._SECOND_LINE_COMPANY_RE.search(lines[1])
             if second_line_match:
-                company_candidate = second_line_match.group(1).strip()
-                # Check if it's followed by a location indicator
-                location_match = re.search(f"{re.escape(company_candidate)}[,\\s|]+([A-Za-z\\s,]+)", lines[1])
-                if location_match:
-                    return company_candidate
-                return company_candidate
+                # The candidate is taken whether or not a location follows it
+                return second_line_match.group(1).strip()
                 
             # Try to extract company name from second line (common format)
-            second_line_parts = re.split(r'[|]', lines[1])
-            if len(second_line_parts) >= 1:
-                # First part before the pipe is often the company name
-                company_candidate = second_line_parts[0].strip()
-                # Check if it looks like a company (not a location)
-                if not re.search(r'\b(in|at|for)\b', company_candidate.lower()):
-                    # Remove trailing commas and spaces
-                    company_candidate = re.sub(r',\s*$', '', company_candidate)
-                    return company_candidate
-        
-        # Check if there are common company keywords
-        company_present = False
-        for pattern in self.company_patterns:
-            if pattern.search(text):
-                company_present = True
-                break
-                
-        # Split by common separators and check each segment
-        check_lines = lines[:2] if len(lines) > 1 else lines
+            # First part before the pipe is often the company name
+            company_candidate = lines[1].partition('|')[0].strip()
+            # Check if it looks like a company (not a location)
+            if not self._LOCATION_WORD_RE.search(company_candidate.lower()):
+                # Remove trailing commas and spaces
+                company_candidate = self._TRAILING_COMMA_RE.sub('', company_candidate)
+                return company_candidate
         
-        for line in check_lines:
-            segments = re.split(r'[,;|]', line)
+        # Split by common separators and check each segment
+        for line in lines[:2]:
+            segments = self._COMPANY_SEPARATOR_RE.split(line)
             
             for segment in segments:
                 clean_segment = segment.strip()
                 
                 # Look for segments that have company keywords
-                for pattern in self.company_patterns:
-                    if pattern.search(clean_segment):
-                        return clean_segment
+                if self.company_regex.search(clean_segment):
+                    return clean_segment
                         
         return None
         
+    def _find_common_company(self, text_lower: str) -> Optional[str]:
+        """
+        Find the first of COMMON_COMPANIES that appears in text, in list order.
+        
+        Args:
+            text_lower: The text lowercased.
+            
+        Returns:
+            The company as listed in COMMON_COMPANIES, or None.
+        """
+        if not USING_AHOCORASICK:
+            for company in self.COMMON_COMPANIES:
+                if company.lower() in text_lower:
+                    return company
+            return None
+            
+        indexes = [index for _, index in self.common_company_automaton.iter(text_lower)]
+        return self.COMMON_COMPANIES[min(indexes)] if indexes else None
+        
     def _extract_date_range(self, text: str) -> Optional[str]:
         """
         Extract date range from text.
@@ -386,10 +607,10 @@ class ExperienceExtractor:
         Returns:
             Extracted date range or None.
         """
-        for pattern in self.date_patterns:
-            match = pattern.search(text)
-            if match:
-                return match.group(0).strip()
+        # The first date pattern that matches anywhere wins
+        match = self.date_regex.match(text)
+        if match:
+            return match.group(match.lastgroup).strip()
                 
         return None
         
@@ -406,17 +627,18 @@ class ExperienceExtractor:
         responsibilities = []
         
         # Look for bullet points
-        for pattern in self.bullet_patterns:
-            matches = pattern.finditer(text)
-            for match in matches:
+        for pattern, marker_pattern in zip(self.bullet_patterns, self.bullet_marker_patterns):
+            matches = list(pattern.finditer(text))
+            for i, match in enumerate(matches):
                 # Find the start of the bullet point
                 start = match.end()
                 
+                # Another marker right away leaves this bullet empty
+                if marker_pattern.match(text, start):
+                    continue
+                
                 # Find the end (next bullet or end of text)
-                end = len(text)
-                for end_match in pattern.finditer(text[start:]):
-                    end = start + end_match.start()
-                    break
+                end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
                 
                 # Extract the bullet point text
                 bullet_text = text[start:end].strip()
@@ -433,4 +655,34 @@ class ExperienceExtractor:
                     if clean_line:
                         responsibilities.append(clean_line)
         
-        return responsibilities 
\ No newline at end of file
+        return responsibilities
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_extractor() -> ExperienceExtractor:
+    """
+    Get the extractor behind the module-level result cache, built on first use.
+    
+    Returns:
+        Extractor shared by every cached extraction.
+    """
+    return ExperienceExtractor()
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_experience_cached(text: str) -> Tuple[_ExperienceRecord, ...]:
+    """
+    Extract work experience details from text, cached by extract_experience.
+    
+    Every extractor compiles the same class-level patterns, so the cache is
+    keyed on the text alone and shared by all of them instead of keeping
+    each one alive.
+    
+    Args:
+        text: Work experience section text.
+        
+    Returns:
+        Tuple of work experience records, shared by every call with the
+        same text.
+    """
+    return _shared_extractor()._extract_experience_records(text)
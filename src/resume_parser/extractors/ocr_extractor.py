@@ -3,11 +3,94 @@ OCR extraction module using pytesseract.
 """
 
 import os
+import threading
 from typing import Dict, List, Optional, Tuple
 
 import pytesseract
 from PIL import Image
 
+try:
+    # tesserocr keeps Tesseract loaded in-process, so the model loads once
+    import tesserocr
+    USING_TESSEROCR = True
+except ImportError:
+    # Fall back to running the tesseract executable per image via pytesseract
+    USING_TESSEROCR = False
+
+from resume_parser.utils.file_utils import ContentCache
+
+# Recognized text of recent images and languages, shared by every extractor
+_text_cache = ContentCache(maxsize=128)
+
+# Wider page images are scaled down to this width, about 300 DPI for a
+# letter or A4 page, which is all the detail Tesseract makes use of
+_MAX_OCR_WIDTH = 2500
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """
+    Find the gray level that best separates text from background (Otsu's method).
+
+    Args:
+        histogram: Pixel counts for each of the 256 gray levels.
+
+    Returns:
+        Threshold gray level; brighter pixels are background.
+    """
+    total = sum(histogram)
+    total_sum = sum(level * count for level, count in enumerate(histogram))
+    
+    background_weight = 0
+    background_sum = 0
+    best_threshold = 0
+    best_variance = -1.0
+    for level, count in enumerate(histogram):
+        background_weight += count
+        if background_weight == 0:
+            continue
+        foreground_weight = total - background_weight
+        if foreground_weight == 0:
+            break
+            
+        background_sum += level * count
+        background_mean = background_sum / background_weight
+        foreground_mean = (total_sum - background_sum) / foreground_weight
+        
+        # Variance between the two classes, up to a constant factor
+        variance = background_weight * foreground_weight * (background_mean - foreground_mean) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+            
+    return best_threshold
+
+
+def _prepare_image(image: Image.Image, max_width: Optional[int] = _MAX_OCR_WIDTH) -> Image.Image:
+    """
+    Reduce an image to what Tesseract needs: black text on white, at most max_width wide.
+
+    Args:
+        image: Image to prepare.
+        max_width: Width to scale larger images down to, or None to keep the
+            size, and with it the coordinates of the recognized text.
+
+    Returns:
+        Binarized grayscale image.
+    """
+    # Transparent areas would turn black in grayscale, so put them on white
+    if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+        image = image.convert("RGBA")
+        background = Image.new("RGBA", image.size, "white")
+        image = Image.alpha_composite(background, image)
+        
+    image = image.convert("L")
+    if max_width and image.width > max_width:
+        height = max(1, image.height * max_width // image.width)
+        image = image.resize((max_width, height), Image.LANCZOS)
+        
+    threshold = _otsu_threshold(image.histogram())
+    return image.point([0 if level <= threshold else 255 for level in range(256)])
+
 
 class OCRExtractor:
     """
@@ -23,10 +106,34 @@ class OCRExtractor:
         """
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+            
+        # A specific executable was asked for, so keep running it
+        self.use_tesserocr = USING_TESSEROCR and not tesseract_cmd
+        # Loaded Tesseract APIs by language, which one thread at a time may use
+        self._apis: Dict[str, "tesserocr.PyTessBaseAPI"] = {}
+        self._api_lock = threading.Lock()
+        
+    def __enter__(self) -> "OCRExtractor":
+        """Use the extractor as a context manager that closes it on exit."""
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        """Close the extractor."""
+        self.close()
+        
+    def close(self) -> None:
+        """Release the loaded Tesseract models."""
+        with self._api_lock:
+            for api in self._apis.values():
+                api.End()
+            self._apis.clear()
     
     def extract_text(self, file_path: str, lang: str = "eng") -> str:
         """
         Extract text from an image using OCR.
+        
+        Results are cached by a hash of the file's content, so the same
+        image is only recognized once per language, whatever its path.
 
         Args:
             file_path: Path to the image file.
@@ -43,11 +150,73 @@ class OCRExtractor:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            image = Image.open(file_path)
-            text = pytesseract.image_to_string(image, lang=lang)
-            return text.strip()
+            return _text_cache.get(file_path, lambda: self._extract_text_uncached(file_path, lang), lang)
+        except OSError as e:
+            # The cache reads the file to hash it before recognition starts
+            raise ValueError(f"Error processing image with OCR: {e}")
+        
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached text of every image."""
+        _text_cache.clear()
+        
+    def _extract_text_uncached(self, file_path: str, lang: str) -> str:
+        """
+        Extract text from an image using OCR, without the cache.
+
+        Args:
+            file_path: Path to the image file.
+            lang: Language for OCR.
+
+        Returns:
+            Extracted text content.
+        """
+        try:
+            image = _prepare_image(Image.open(file_path))
+            return self._image_to_string(image, lang).strip()
         except Exception as e:
             raise ValueError(f"Error processing image with OCR: {e}")
+            
+    def extract_text_batch(self, file_paths: List[str], lang: str = "eng") -> List[str]:
+        """
+        Extract text from many images using OCR.
+        
+        With tesserocr installed, every image goes through the same loaded
+        Tesseract model instead of starting the executable once per image.
+
+        Args:
+            file_paths: Paths to the image files.
+            lang: Language for OCR (default: eng).
+
+        Returns:
+            Extracted text content of each image, in input order.
+
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            ValueError: If a file is not a valid image.
+        """
+        return [self.extract_text(file_path, lang=lang) for file_path in file_paths]
+            
+    def _image_to_string(self, image: Image.Image, lang: str) -> str:
+        """
+        Run OCR on an image with tesserocr if available, else pytesseract.
+
+        Args:
+            image: Image to read.
+            lang: Language for OCR.
+
+        Returns:
+            Recognized text.
+        """
+        if not self.use_tesserocr:
+            return pytesseract.image_to_string(image, lang=lang)
+            
+        with self._api_lock:
+            api = self._apis.get(lang)
+            if api is None:
+                api = self._apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+            api.SetImage(image)
+            return api.GetUTF8Text()
     
     def extract_text_with_coordinates(self, file_path: str, lang: str = "eng") -> List[Dict]:
         """
@@ -64,29 +233,35 @@ class OCRExtractor:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            image = Image.open(file_path)
+            # Keep the size, so coordinates refer to the original image
+            image = _prepare_image(Image.open(file_path), max_width=None)
             data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
             
             results = []
-            n_boxes = len(data['text'])
             
-            for i in range(n_boxes):
+            # Walk the columns together instead of indexing every list per box
+            rows = zip(
+                data['text'], data['conf'], data['left'], data['top'],
+                data['width'], data['height'], data['line_num'],
+                data['block_num'], data['page_num']
+            )
+            for text, conf, left, top, width, height, line_num, block_num, page_num in rows:
                 # Skip empty text
-                if int(data['conf'][i]) > 0 and data['text'][i].strip():
-                    text_data = {
-                        'text': data['text'][i],
-                        'confidence': int(data['conf'][i]),
+                confidence = int(conf)
+                if confidence > 0 and text.strip():
+                    results.append({
+                        'text': text,
+                        'confidence': confidence,
                         'coordinates': {
-                            'x': data['left'][i],
-                            'y': data['top'][i],
-                            'width': data['width'][i],
-                            'height': data['height'][i]
+                            'x': left,
+                            'y': top,
+                            'width': width,
+                            'height': height
                         },
-                        'line_num': data['line_num'][i],
-                        'block_num': data['block_num'][i],
-                        'page_num': data['page_num'][i]
-                    }
-                    results.append(text_data)
+                        'line_num': line_num,
+                        'block_num': block_num,
+                        'page_num': page_num
+                    })
             
             return results
         except Exception as e:
@@ -3,6 +3,7 @@ PDF text extraction module using pypdf (migrated from PyPDF2).
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
 
 try:
@@ -14,6 +15,34 @@ except ImportError:
     import PyPDF2
     USING_PYPDF = False
 
+from resume_parser.utils.file_utils import ContentCache
+
+# Each worker reopens and re-parses the whole file, and starting the pool
+# costs about as much as reading a page, so shorter documents are always
+# read in this process
+_PARALLEL_MIN_PAGES = 8
+
+# Text of recently read files, shared by every extractor
+_text_cache = ContentCache(maxsize=128)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of a range of pages, in a worker process.
+
+    Args:
+        file_path: Path to the PDF file.
+        start: Index of the first page.
+        stop: Index one past the last page.
+
+    Returns:
+        Text of each page in the range.
+    """
+    with open(file_path, "rb") as file:
+        pdf_module = pypdf if USING_PYPDF else PyPDF2
+        pdf_reader = pdf_module.PdfReader(file)
+        return [pdf_reader.pages[page_num].extract_text() for page_num in range(start, stop)]
+
 
 class PDFExtractor:
     """
@@ -24,12 +53,48 @@ class PDFExtractor:
         """Initialize the PDF extractor."""
         pass
 
-    def extract_text(self, file_path: str) -> str:
+    def extract(self, file_path: str, workers: Optional[int] = None) -> Dict:
+        """
+        Extract both text and metadata from a PDF file, parsing it only once.
+
+        Args:
+            file_path: Path to the PDF file.
+            workers: Number of worker processes, as for extract_text.
+
+        Returns:
+            Dictionary with the extracted "text" and the "metadata" dictionary.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: If the file is not a valid PDF.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            with open(file_path, "rb") as file:
+                pdf_reader = self._open_reader(file)
+                return {
+                    "text": self._read_text(pdf_reader, file_path, workers),
+                    "metadata": self._read_metadata(pdf_reader),
+                }
+        except Exception as e:
+            raise Exception(f"Error reading PDF: {e}")
+
+    def extract_text(self, file_path: str, workers: Optional[int] = None) -> str:
         """
         Extract text from a PDF file.
 
+        Page text extraction is CPU-bound pure Python, so callers may ask
+        for the pages of longer documents to be split between worker
+        processes. Results are cached by a hash of the file's content, so the
+        same document is only parsed once, whatever path it was saved to.
+
         Args:
             file_path: Path to the PDF file.
+            workers: Number of worker processes. By default, with a single
+                worker, or for a document shorter than _PARALLEL_MIN_PAGES
+                pages, every page is read in this process.
 
         Returns:
             Extracted text content.
@@ -41,30 +106,31 @@ class PDFExtractor:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        text = ""
-        
+        try:
+            return _text_cache.get(file_path, lambda: self._extract_text_uncached(file_path, workers))
+        except OSError as e:
+            # The cache reads the file to hash it before parsing starts
+            raise Exception(f"Error reading PDF: {e}")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached text of every file."""
+        _text_cache.clear()
+
+    def _extract_text_uncached(self, file_path: str, workers: Optional[int]) -> str:
+        """
+        Extract text from a PDF file, without the cache.
+
+        Args:
+            file_path: Path to the PDF file.
+            workers: Number of worker processes, as for extract_text.
+
+        Returns:
+            Extracted text content.
+        """
         try:
             with open(file_path, "rb") as file:
-                if USING_PYPDF:
-                    # Use pypdf library
-                    pdf_reader = pypdf.PdfReader(file)
-                    num_pages = len(pdf_reader.pages)
-                    
-                    for page_num in range(num_pages):
-                        page = pdf_reader.pages[page_num]
-                        # pypdf has a simpler extract_text method without parameters
-                        text += page.extract_text() + "\n"
-                else:
-                    # Use PyPDF2 library (legacy support)
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    num_pages = len(pdf_reader.pages)
-                    
-                    for page_num in range(num_pages):
-                        page = pdf_reader.pages[page_num]
-                        # PyPDF2 3.0.1+ no longer needs these parameters
-                        text += page.extract_text() + "\n"
-                    
-            return text.strip()
+                return self._read_text(self._open_reader(file), file_path, workers)
         except Exception as e:
             raise Exception(f"Error reading PDF: {e}")
         
@@ -83,34 +149,94 @@ class PDFExtractor:
             
         try:
             with open(file_path, "rb") as file:
-                if USING_PYPDF:
-                    # Use pypdf library
-                    pdf_reader = pypdf.PdfReader(file)
-                    metadata = pdf_reader.metadata
-                    
-                    # Convert metadata to regular dictionary
-                    meta_dict = {}
-                    if metadata:
-                        # In pypdf, metadata is directly a dictionary-like object
-                        for key, value in metadata.items():
-                            meta_dict[key] = value
-                    
-                    # Add document info
-                    meta_dict["pages"] = len(pdf_reader.pages)
-                else:
-                    # Use PyPDF2 (legacy support)
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    metadata = pdf_reader.metadata
-                    
-                    # Convert metadata to regular dictionary
-                    meta_dict = {}
-                    if metadata:
-                        for key in metadata:
-                            meta_dict[key] = metadata[key]
-                    
-                    # Add document info
-                    meta_dict["pages"] = len(pdf_reader.pages)
-                
-                return meta_dict
+                return self._read_metadata(self._open_reader(file))
         except Exception as e:
-            raise Exception(f"Error reading PDF metadata: {e}") 
\ No newline at end of file
+            raise Exception(f"Error reading PDF metadata: {e}")
+
+    def _open_reader(self, file):
+        """
+        Create a PDF reader for an open file.
+
+        Args:
+            file: PDF file opened in binary mode.
+
+        Returns:
+            pypdf or PyPDF2 PdfReader.
+        """
+        if USING_PYPDF:
+            # Use pypdf library
+            return pypdf.PdfReader(file)
+        # Use PyPDF2 library (legacy support)
+        return PyPDF2.PdfReader(file)
+
+    def _read_text(self, pdf_reader, file_path: str, workers: Optional[int]) -> str:
+        """
+        Read the text of every page from an open PDF reader.
+
+        Args:
+            pdf_reader: Reader for the PDF file.
+            file_path: Path to the PDF file, for worker processes to open.
+            workers: Number of worker processes, as for extract_text.
+
+        Returns:
+            Extracted text content.
+        """
+        num_pages = len(pdf_reader.pages)
+        
+        # Only a caller asking for workers gets a process pool
+        workers = min(workers or 1, num_pages)
+        if workers > 1 and num_pages >= _PARALLEL_MIN_PAGES:
+            page_texts = self._extract_pages_in_parallel(file_path, num_pages, workers)
+        else:
+            # Both libraries' extract_text need no parameters
+            page_texts = [page.extract_text() for page in pdf_reader.pages]
+            
+        # Joined in one pass; the newline after the last page is stripped anyway
+        return "\n".join(page_texts).strip()
+        
+    def _extract_pages_in_parallel(self, file_path: str, num_pages: int, workers: int) -> List[str]:
+        """
+        Extract the text of every page, split into ranges between worker processes.
+
+        Args:
+            file_path: Path to the PDF file.
+            num_pages: Number of pages in the document.
+            workers: Number of worker processes.
+
+        Returns:
+            Text of each page, in page order.
+        """
+        bounds = [num_pages * worker // workers for worker in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ranges = executor.map(
+                _extract_page_range, [file_path] * workers, bounds[:-1], bounds[1:]
+            )
+            return [page_text for page_texts in ranges for page_text in page_texts]
+
+    def _read_metadata(self, pdf_reader) -> Dict:
+        """
+        Read the document information and page count from an open PDF reader.
+
+        Args:
+            pdf_reader: Reader for the PDF file.
+
+        Returns:
+            Dictionary containing PDF metadata.
+        """
+        metadata = pdf_reader.metadata
+        
+        # Convert metadata to regular dictionary
+        meta_dict = {}
+        if metadata:
+            if USING_PYPDF:
+                # In pypdf, metadata is directly a dictionary-like object
+                for key, value in metadata.items():
+                    meta_dict[key] = value
+            else:
+                # PyPDF2 (legacy support)
+                for key in metadata:
+                    meta_dict[key] = metadata[key]
+        
+        # Add document info
+        meta_dict["pages"] = len(pdf_reader.pages)
+        return meta_dict
@@ -20,6 +20,13 @@ class ProjectsExtractor:
         r"(?i)(?:^|\s)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}\s*-\s*(Present|Ongoing|Current)(?:\s|$|,|\.)",
         r"(?i)(?:^|\s)(\d{4})(?:\s|$|,|\.)"
     ]
+    # Every date pattern needs a run of four digits
+    _YEAR_RE = re.compile(r"\d{4}")
+
+    # Blank lines between project entries
+    _ENTRY_SPLIT_RE = re.compile(r'\n\s*\n')
+    # A capitalized line, often a new project name, when there are no blank lines
+    _ENTRY_START_RE = re.compile(r'\n([A-Z][a-zA-Z0-9 ]+)[\s:–-]')
 
     # Technology/tool patterns
     TECHNOLOGY_PATTERNS = [
@@ -39,6 +46,10 @@ class ProjectsExtractor:
         self.date_patterns = [re.compile(pattern) for pattern in self.DATE_PATTERNS]
         self.technology_patterns = [re.compile(pattern) for pattern in self.TECHNOLOGY_PATTERNS]
         self.bullet_patterns = [re.compile(pattern) for pattern in self.BULLET_PATTERNS]
+        # The bullet markers alone, without the line-start anchor
+        self.bullet_marker_patterns = [
+            re.compile(pattern.replace(r"(?:^|\n)", "", 1)) for pattern in self.BULLET_PATTERNS
+        ]
 
     def extract_projects(self, text: str) -> List[Dict]:
         """
@@ -62,11 +73,12 @@ class ProjectsExtractor:
             if not clean_entry:
                 continue
                 
-            # Extract details from the entry
-            project_name = self._extract_project_name(entry)
+            # Extract details from the entry, splitting its lines only once
+            entry_lines = entry.split('\n')
+            project_name = self._extract_project_name(entry, entry_lines)
             date_range = self._extract_date_range(clean_entry)
             technologies = self._extract_technologies(clean_entry)
-            description = self._extract_description(entry)
+            description = self._extract_description(entry, entry_lines)
             
             # Only add entries that have at least a project name
             if project_name:
@@ -93,15 +105,13 @@ class ProjectsExtractor:
             List of project entry texts.
         """
         # Try to split by double line breaks first
-        entries = re.split(r'\n\s*\n', text)
+        entries = self._ENTRY_SPLIT_RE.split(text)
         
         # If that didn't work well, try single line breaks when followed by a capitalized word
         # (which is often a new project name)
         if len(entries) <= 1:
-            entry_start_pattern = re.compile(r'\n([A-Z][a-zA-Z0-9 ]+)[\s:–-]')
-            
             entry_starts = [0]  # Start of text
-            for match in entry_start_pattern.finditer(text):
+            for match in self._ENTRY_START_RE.finditer(text):
                 entry_starts.append(match.start())
                 
             entry_starts.append(len(text))  # End of text
@@ -117,26 +127,29 @@ class ProjectsExtractor:
         # Filter out empty entries
         return [entry.strip() for entry in entries if entry.strip()]
         
-    def _extract_project_name(self, text: str) -> Optional[str]:
+    def _extract_project_name(self, text: str, lines: Optional[List[str]] = None) -> Optional[str]:
         """
         Extract project name from text.
         
         Args:
             text: Project entry text.
+            lines: Lines of the text, if the caller already split them.
             
         Returns:
             Extracted project name or None.
         """
         # Project name is typically the first line or before the first colon
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
         first_line = lines[0] if lines else ""
         
         # Check if the first line contains a project name
         if ":" in first_line:
             return first_line.split(":", 1)[0].strip()
         else:
-            # Split by common separators and return the first segment
-            segments = re.split(r'[,;|\n]', first_line)
+            # Split by common separators and return the first segment; the
+            # first line holds no newline
+            segments = first_line.replace(";", ",").replace("|", ",").split(",")
             return segments[0].strip() if segments else None
         
     def _extract_date_range(self, text: str) -> Optional[str]:
@@ -149,6 +162,10 @@ class ProjectsExtractor:
         Returns:
             Extracted date range or None.
         """
+        # One scan rules out the undated entries before any pattern runs
+        if not self._YEAR_RE.search(text):
+            return None
+            
         for pattern in self.date_patterns:
             match = pattern.search(text)
             if match:
@@ -166,7 +183,8 @@ class ProjectsExtractor:
         Returns:
             List of technologies.
         """
-        technologies = []
+        # Insertion-ordered keys keep the first occurrence of each technology
+        technologies = {}
         
         # Look for technology sections
         for pattern in self.technology_patterns:
@@ -177,8 +195,8 @@ class ProjectsExtractor:
                     tech_text = match.group(2)
                     for tech in tech_text.split(","):
                         clean_tech = tech.strip()
-                        if clean_tech and clean_tech not in technologies:
-                            technologies.append(clean_tech)
+                        if clean_tech:
+                            technologies.setdefault(clean_tech)
                 else:
                     # Find the text after the technology keyword until the end of line
                     start_pos = match.end()
@@ -190,52 +208,57 @@ class ProjectsExtractor:
                     if ":" in tech_text:
                         tech_text = tech_text.split(":", 1)[1].strip()
                     
-                    # Split by commas or other separators
-                    for tech in re.split(r'[,;]', tech_text):
+                    # Split by commas or other separators; chained str.replace
+                    # beats both re.split and a str.translate table on lines this short
+                    for tech in tech_text.replace(";", ",").split(","):
                         clean_tech = tech.strip()
-                        if clean_tech and clean_tech not in technologies:
-                            technologies.append(clean_tech)
+                        if clean_tech:
+                            technologies.setdefault(clean_tech)
         
-        return technologies
+        return list(technologies)
         
-    def _extract_description(self, text: str) -> List[str]:
+    def _extract_description(self, text: str, lines: Optional[List[str]] = None) -> List[str]:
         """
         Extract project description.
         
         Args:
             text: Project entry text.
+            lines: Lines of the text, if the caller already split them.
             
         Returns:
             List of description points.
         """
-        description = []
+        # Insertion-ordered keys keep the first occurrence of each point
+        description = {}
         
         # Look for bullet points
-        for pattern in self.bullet_patterns:
-            matches = pattern.finditer(text)
-            for match in matches:
+        for pattern, marker_pattern in zip(self.bullet_patterns, self.bullet_marker_patterns):
+            matches = list(pattern.finditer(text))
+            for i, match in enumerate(matches):
                 # Find the start of the bullet point
                 start = match.end()
                 
+                # Another marker right away leaves this bullet empty
+                if marker_pattern.match(text, start):
+                    continue
+                
                 # Find the end (next bullet or end of text)
-                end = len(text)
-                for end_match in pattern.finditer(text[start:]):
-                    end = start + end_match.start()
-                    break
+                end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
                 
                 # Extract the bullet point text
                 bullet_text = text[start:end].strip()
-                if bullet_text and bullet_text not in description:
-                    description.append(bullet_text)
+                if bullet_text:
+                    description.setdefault(bullet_text)
         
         # If no bullet points found, try to extract description from lines after the first line
         if not description:
-            lines = text.split('\n')
+            if lines is None:
+                lines = text.split('\n')
             if len(lines) > 1:
                 # Skip the first line (typically project name)
                 for line in lines[1:]:
                     clean_line = line.strip()
-                    if clean_line and clean_line not in description:
-                        description.append(clean_line)
+                    if clean_line:
+                        description.setdefault(clean_line)
         
-        return description 
\ No newline at end of file
+        return list(description) 
\ No newline at end of file
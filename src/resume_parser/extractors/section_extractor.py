@@ -2,8 +2,18 @@
 Section extraction module for identifying resume sections.
 """
 
+import bisect
+import functools
+import itertools
 import re
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from resume_parser.utils import text_preprocessing
+
+# Aho-Corasick finds every line holding a section keyword in one pass;
+# without pyahocorasick every line is checked for a section title
+USING_AHOCORASICK = text_preprocessing.USING_AHOCORASICK
 
 
 class SectionExtractor:
@@ -24,33 +34,26 @@ class SectionExtractor:
         'experience': [
             r'^\s*(?:experience|work\s+experience|professional\s+experience|employment(?:\s+history)?|work\s+history)\s*$',
             r'^\s*(?:career(?:\s+history)?|professional\s+background|relevant\s+experience|professional\s+history)\s*$',
-            r'^\s*EXPERIENCE\s*$',  # Add specific uppercase pattern
-            r'^\s*WORK\s+EXPERIENCE\s*$',  # Add specific uppercase pattern
-            r'^\s*(?:internship|internships|intern\s+experience)\s*$',  # Add internship patterns
-            r'^\s*INTERNSHIP\s*$'  # Add specific uppercase internship pattern
+            r'^\s*(?:internship|internships|intern\s+experience)\s*$'  # Add internship patterns
         ],
         'education': [
             r'^\s*(?:education(?:al)?(?:\s+background|(?:\s+and\s+training)?)?|academic(?:s|(?:\s+background)?))\s*$',
             r'^\s*(?:qualifications|educational\s+qualifications|schooling)\s*$',
-            r'^\s*(?:degrees?|academic\s+degrees?)\s*$',
-            r'^\s*EDUCATION\s*$'  # Add specific uppercase pattern
+            r'^\s*(?:degrees?|academic\s+degrees?)\s*$'
         ],
         'skills': [
             r'^\s*(?:(?:technical\s+)?skills|(?:core\s+)?competenc(?:y|ies)|areas\s+of\s+expertise|expertise)\s*$',
             r'^\s*(?:technical|languages|computer|professional|specialized|specific|special)\s+skills\s*$',
             r'^\s*(?:skill\s+set|skill\s+summary|technical\s+expertise|technical\s+proficiencies)\s*$',
-            r'^\s*(?:technologies|tools|software|programming\s+languages|languages|frameworks|platforms)\s*$',
-            r'^\s*SKILLS\s*$'  # Add specific uppercase pattern
+            r'^\s*(?:technologies|tools|software|programming\s+languages|languages|frameworks|platforms)\s*$'
         ],
         'certifications': [
             r'^\s*(?:certifications?|professional\s+certifications?|accreditations?|credentials?)\s*$',
-            r'^\s*(?:licenses?|professional\s+licenses?|technical\s+certifications?)\s*$',
-            r'^\s*CERTIFICATIONS\s*$'  # Add specific uppercase pattern
+            r'^\s*(?:licenses?|professional\s+licenses?|technical\s+certifications?)\s*$'
         ],
         'projects': [
             r'^\s*(?:projects?|personal\s+projects?|academic\s+projects?|key\s+projects?)\s*$',
-            r'^\s*(?:portfolio|work\s+samples|relevant\s+projects|professional\s+projects?)\s*$',
-            r'^\s*PROJECTS\s*$'  # Add specific uppercase pattern
+            r'^\s*(?:portfolio|work\s+samples|relevant\s+projects|professional\s+projects?)\s*$'
         ],
         'publications': [
             r'^\s*(?:publications?|research(?:\s+publications?)?|papers|articles|conference\s+(?:papers|presentations))\s*$',
@@ -85,24 +88,54 @@ class SectionExtractor:
         r'^[\-\=]{2,}\s*[\w\s]+\s*[\-\=]{2,}$'  # Section title surrounded by separators
     ]
 
-    def __init__(self):
-        """Initialize the section extractor."""
-        # Compile regex patterns for faster matching
-        self.compiled_sections = {}
-        for section, patterns in self.SECTION_TITLES.items():
-            self.compiled_sections[section] = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-        
-        self.separator_patterns = [re.compile(pattern) for pattern in self.SECTION_SEPARATORS]
-        
-        # Add special case patterns for all uppercase section headers without regex flags
-        # This helps catch section headers like "EXPERIENCE" exactly as they appear
-        self.uppercase_patterns = {
-            'experience': re.compile(r'^\s*EXPERIENCE\s*$'),
-            'education': re.compile(r'^\s*EDUCATION\s*$'),
-            'skills': re.compile(r'^\s*SKILLS\s*$'),
-            'projects': re.compile(r'^\s*PROJECTS\s*$'),
-            'certifications': re.compile(r'^\s*CERTIFICATIONS\s*$')
-        }
+    # Every title SECTION_TITLES matches contains one of these
+    _SECTION_KEYWORDS = (
+        "name", "personal", "contact", "profile", "summary", "about", "objective", "goal",
+        "experience", "employment", "work", "career", "professional", "intern",
+        "education", "academic", "qualification", "schooling", "degree",
+        "skill", "competenc", "expertise", "proficienc", "technolog", "tools", "software",
+        "language", "framework", "platform", "certificat", "accreditation", "credential",
+        "license", "project", "portfolio", "publication", "research", "paper",
+        "article", "conference", "journal", "published", "scholarly", "award", "honor",
+        "recognition", "achievement", "accomplishment", "prize", "scholarship", "fellowship",
+        "grant", "linguistic", "interest", "hobb", "activities", "reference", "recommendation",
+        "endorsement", "referee", "volunteer", "community", "civic", "philanthropy", "voluntary"
+    )
+    # Keywords suggesting a section in text without section titles, by
+    # priority, in one alternation where the group that matched names the section
+    _FALLBACK_SECTION_KEYWORDS = {
+        'education': r'degree|university|college|school|gpa|bachelor|master|phd|diploma',
+        'experience': r'experience|work|job|position|employer|company|responsibilities',
+        'skills': r'skills|proficient|expertise|competenc|abilities',
+        'certifications': r'certification|certified|license|accredit|credential'
+    }
+    _FALLBACK_SECTION_RE = re.compile(
+        r'\b(?:' + '|'.join(f'(?P<{section}>{words})' for section, words in _FALLBACK_SECTION_KEYWORDS.items()) + r')\b'
+    )
+    # Formatting characters _identify_section_title removes before matching
+    _TITLE_DECORATION = str.maketrans("", "", ":-_=*#•■□▪▫")
+    _TITLE_DECORATION_RE = re.compile(r'[:\-_=*#•■□▪▫]')
+    # Most non-space characters any SECTION_TITLES pattern matches, in
+    # "professional certifications" and "extracurricular activities"
+    _MAX_TITLE_LETTERS = 26
+
+    # Patterns are compiled once, here, and shared by every instance.
+    # Every section title pattern is in one alternation, tried in
+    # SECTION_TITLES order; the group that matched names the section
+    section_title_regex = re.compile(
+        "|".join(
+            f"(?P<{section}>" + "|".join(patterns) + ")"
+            for section, patterns in SECTION_TITLES.items()
+        ),
+        re.IGNORECASE
+    )
+
+    # Every separator pattern is anchored at both ends, so one
+    # alternation matches exactly the lines one of them matches
+    separator_regex = re.compile("|".join(f"(?:{pattern})" for pattern in SECTION_SEPARATORS))
+
+    if USING_AHOCORASICK:
+        section_keyword_automaton = text_preprocessing.build_keyword_automaton(_SECTION_KEYWORDS)
 
     def extract_sections(self, text: str) -> Dict[str, str]:
         """
@@ -151,6 +184,27 @@ class SectionExtractor:
         
         return sections
     
+    def extract_sections_batch(self, texts: List[str], workers: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Extract sections from many resume texts in parallel.
+        
+        Section detection is CPU-bound, so the texts are spread over worker
+        processes. Each worker keeps its own section title cache.
+        
+        Args:
+            texts: Resume texts.
+            workers: Number of worker processes; defaults to the CPU count.
+                With a single worker or text, everything runs in this process.
+        
+        Returns:
+            List of section dictionaries, one per text, in input order.
+        """
+        if workers == 1 or len(texts) <= 1:
+            return [self.extract_sections(text) for text in texts]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_sections, texts, chunksize=32))
+    
     def _identify_section_boundaries(self, text: str) -> List:
         """
         Identify section boundaries in text.
@@ -163,79 +217,111 @@ class SectionExtractor:
         """
         section_boundaries = []
         
-        # Split the text into lines for analysis
+        # Split the text into lines for analysis, with where each one starts
         lines = text.split('\n')
+        line_starts = self._line_starts(lines)
         
-        current_position = 0
         header_found = False
         
-        for i, line in enumerate(lines):
+        # Lines without a section keyword can't be titles and skip the checks
+        title_lines = self._find_title_candidate_lines(text, lines)
+        
+        # A line can only start a section as a title or as a separator right
+        # before a title, so with the titles known just those lines are visited
+        if title_lines is None:
+            candidate_lines = range(len(lines))
+        else:
+            candidate_lines = sorted(title_lines.union(i - 1 for i in title_lines if i))
+        
+        for i in candidate_lines:
+            line = lines[i]
             line_clean = line.strip()
-            line_start_pos = current_position
+            line_start_pos = line_starts[i]
             
             # Skip completely empty lines or short lines that are just separators
             if not line_clean or len(line_clean) < 2:
-                current_position += len(line) + 1  # +1 for the newline
                 continue
             
             # Check if the line is a visual separator
-            is_separator = False
-            for pattern in self.separator_patterns:
-                if pattern.match(line_clean):
-                    is_separator = True
-                    break
+            is_separator = self.separator_regex.match(line_clean) is not None
             
             # If it's a separator, check the next line for a section title
-            if is_separator and i + 1 < len(lines):
+            if is_separator and i + 1 < len(lines) and (title_lines is None or i + 1 in title_lines):
                 next_line = lines[i + 1].strip()
                 section_name = self._identify_section_title(next_line)
                 if section_name:
-                    section_boundaries.append((section_name, current_position))
+                    section_boundaries.append((section_name, line_start_pos))
             
-            # Check for exact uppercase matches first (higher priority)
-            uppercase_section = None
-            for section, pattern in self.uppercase_patterns.items():
-                if pattern.match(line_clean):
-                    uppercase_section = section
-                    break
-                    
-            if uppercase_section:
+            if title_lines is not None and i not in title_lines:
+                continue
+            
+            # Check for section title patterns
+            section_name = self._identify_section_title(line_clean)
+            if section_name:
                 # Handle the special case of the header (beginning of resume)
                 if not header_found and line_start_pos < 200:  # Assume header is near the beginning
                     if not section_boundaries or section_boundaries[0][0] != 'header':
                         section_boundaries.insert(0, ('header', 0))
                         header_found = True
                 
-                # Add this uppercase section boundary
-                section_boundaries.append((uppercase_section, current_position))
-            else:
-                # Otherwise check for regular section title patterns
-                section_name = self._identify_section_title(line_clean)
-                if section_name:
-                    # Handle the special case of the header (beginning of resume)
-                    if not header_found and line_start_pos < 200:  # Assume header is near the beginning
-                        if not section_boundaries or section_boundaries[0][0] != 'header':
-                            section_boundaries.insert(0, ('header', 0))
-                            header_found = True
-                    
-                    # Add this section boundary
-                    section_boundaries.append((section_name, current_position))
-            
-            current_position += len(line) + 1  # +1 for the newline
+                # Add this section boundary
+                section_boundaries.append((section_name, line_start_pos))
         
         # If no sections were identified and text isn't empty, use heuristics
         if not section_boundaries and text.strip():
-            section_boundaries = self._fallback_section_identification(text, lines)
+            section_boundaries = self._fallback_section_identification(text, lines, line_starts)
         
         return section_boundaries
     
-    def _fallback_section_identification(self, text: str, lines: List[str]) -> List:
+    def _line_starts(self, lines: List[str]) -> List[int]:
+        """
+        Compute where each line starts in the text it was split from.
+        
+        Args:
+            lines: Lines of a text, split at newlines.
+            
+        Returns:
+            Start offset of each line, then the length of the text plus one.
+        """
+        # +1 for the newline after each line
+        return list(itertools.accumulate((len(line) + 1 for line in lines), initial=0))
+        
+    def _find_title_candidate_lines(self, text: str, lines: List[str]) -> Optional[Set[int]]:
+        """
+        Find the lines that may be section titles, in one pass over the text.
+        
+        Args:
+            text: Resume text.
+            lines: Lines of the text, split at newlines.
+            
+        Returns:
+            Indexes of the lines holding a section keyword once lowercased and
+            stripped of formatting characters, or None if every line has to
+            be checked.
+        """
+        # Lowercasing only agrees with case-insensitive matching for ASCII
+        if not USING_AHOCORASICK or not text.isascii():
+            return None
+            
+        # Lowercasing and removing formatting keep every newline, so the
+        # folded text has the same lines, each ending before its offset here
+        folded = text.lower().translate(self._TITLE_DECORATION)
+        line_ends = list(itertools.accumulate(len(line) + 1 for line in folded.split('\n')))
+        return {
+            bisect.bisect_right(line_ends, end)
+            for end, _ in self.section_keyword_automaton.iter(folded)
+        }
+        
+    def _fallback_section_identification(
+        self, text: str, lines: List[str], line_starts: Optional[List[int]] = None
+    ) -> List:
         """
         Fallback method to identify sections when standard detection fails.
         
         Args:
             text: Resume text.
             lines: List of lines from the text.
+            line_starts: Start offset of each line, if the caller already has them.
             
         Returns:
             List of tuples containing section name and start position.
@@ -244,37 +330,38 @@ class SectionExtractor:
         
         # Assume the beginning is a header section
         section_boundaries.append(('header', 0))
+        placed_sections = {'header'}
         
-        # Look for patterns that might indicate sections without explicit titles
-        current_position = 0
+        if line_starts is None:
+            line_starts = self._line_starts(lines)
         
+        # Look for patterns that might indicate sections without explicit titles
         for i, line in enumerate(lines):
+            # Once every section is placed, later lines can't add any
+            if len(placed_sections) > len(self._FALLBACK_SECTION_KEYWORDS):
+                break
+                
+            current_position = line_starts[i]
             line_clean = line.strip().lower()
             
-            # Education keywords
-            if (re.search(r'\b(degree|university|college|school|gpa|bachelor|master|phd|diploma)\b', line_clean) and 
-                not any(section[0] == 'education' for section in section_boundaries)):
-                section_boundaries.append(('education', current_position))
-            
-            # Experience keywords
-            elif (re.search(r'\b(experience|work|job|position|employer|company|responsibilities)\b', line_clean) and 
-                  not any(section[0] == 'experience' for section in section_boundaries)):
-                section_boundaries.append(('experience', current_position))
-            
-            # Skills keywords
-            elif (re.search(r'\b(skills|proficient|expertise|competenc|abilities)\b', line_clean) and 
-                  not any(section[0] == 'skills' for section in section_boundaries)):
-                section_boundaries.append(('skills', current_position))
-            
-            # Certifications keywords
-            elif (re.search(r'\b(certification|certified|license|accredit|credential)\b', line_clean) and 
-                  not any(section[0] == 'certifications' for section in section_boundaries)):
-                section_boundaries.append(('certifications', current_position))
+            # Every whole keyword in the line, in one scan; keywords are
+            # whole words, so their matches never overlap
+            found_sections = {match.lastgroup for match in self._FALLBACK_SECTION_RE.finditer(line_clean)}
             
-            current_position += len(line) + 1  # +1 for the newline
+            # The first section by priority that was found and isn't placed yet
+            for section in self._FALLBACK_SECTION_KEYWORDS:
+                if section in found_sections and section not in placed_sections:
+                    section_boundaries.append((section, current_position))
+                    placed_sections.add(section)
+                    break
         
         return section_boundaries
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached section title of every line."""
+        _classify_section_title.cache_clear()
+    
     def _identify_section_title(self, line: str) -> str:
         """
         Identify if a line is a section title.
@@ -285,35 +372,7 @@ class SectionExtractor:
         Returns:
             Section name if the line is a section title, None otherwise.
         """
-        # Clean the line to standardize matching
-        clean_line = line.strip().lower()
-        
-        # Remove common formatting characters
-        clean_line = re.sub(r'[:\-_=*#•■□▪▫]', '', clean_line).strip()
-        
-        # Try to match with known section titles
-        for section, patterns in self.compiled_sections.items():
-            for pattern in patterns:
-                if pattern.match(clean_line):
-                    return section
-        
-        # Look for capitalized words that might be section headers
-        if (clean_line.isupper() or clean_line.istitle()) and len(clean_line) < 30:
-            # Map common uppercase/titlecase headers to our section names
-            if re.search(r'\b(EXPERIENCE|WORK|EMPLOYMENT|PROFESSIONAL)\b', line):
-                return 'experience'
-            elif re.search(r'\b(EDUCATION|ACADEMIC|QUALIFICATION|DEGREE)\b', line):
-                return 'education'
-            elif re.search(r'\b(SKILL|COMPETENC|EXPERTISE|PROFICIENC)\b', line):
-                return 'skills'
-            elif re.search(r'\b(CERTIFICATE|CERTIFICATION|LICENSE|CREDENTIAL)\b', line):
-                return 'certifications'
-            elif re.search(r'\b(PROJECT|PORTFOLIO|CASE STUD)\b', line):
-                return 'projects'
-            elif re.search(r'\b(LANGUAGE)\b', line) and not re.search(r'\b(PROGRAMMING|COMPUTER)\b', line):
-                return 'languages'
-            
-        return None
+        return _classify_section_title(line)
     
     def _clean_section_title(self, section_text: str, section_name: str) -> str:
         """
@@ -370,4 +429,40 @@ class SectionExtractor:
             # Add the section as is if no special processing was needed
             processed_sections[section_name] = section_text
         
-        return processed_sections 
\ No newline at end of file
+        return processed_sections
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_section_title(line: str) -> Optional[str]:
+    """
+    Identify if a line is a section title, for SectionExtractor.
+    
+    Results are cached per line, as _clean_section_title checks the first
+    lines of each section again, and resumes repeat lines. The patterns are
+    class-level, so the cache is keyed on the line alone and shared by
+    every extractor instead of keeping each one alive.
+    
+    Args:
+        line: Line of text.
+        
+    Returns:
+        Section name if the line is a section title, None otherwise.
+    """
+    # Clean the line to standardize matching
+    clean_line = line.strip().lower()
+    
+    # Remove common formatting characters
+    clean_line = SectionExtractor._TITLE_DECORATION_RE.sub('', clean_line).strip()
+    
+    # Sentences and other long lines can't be titles: no pattern matches
+    # this many non-space characters
+    max_letters = SectionExtractor._MAX_TITLE_LETTERS
+    if len(clean_line) > max_letters and len("".join(clean_line.split())) > max_letters:
+        return None
+    
+    # Try to match with known section titles, all in one match
+    section_match = SectionExtractor.section_title_regex.match(clean_line)
+    if section_match:
+        return section_match.lastgroup
+    
+    return None
@@ -3,6 +3,7 @@ Main Resume Parser module.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Union
 
 from resume_parser.extractors.certifications_extractor import CertificationsExtractor
@@ -17,6 +18,52 @@ from resume_parser.extractors.skills_extractor import SkillsExtractor
 from resume_parser.extractors.txt_extractor import TxtExtractor
 from resume_parser.utils import file_utils, text_preprocessing
 
+# Parser of each parse_batch worker process, built once per process
+_worker_parser = None
+
+
+def _init_worker(tesseract_cmd: Optional[str]) -> None:
+    """
+    Build the resume parser of a parse_batch worker process.
+
+    Args:
+        tesseract_cmd: Path to tesseract executable (for OCR).
+    """
+    global _worker_parser
+    _worker_parser = ResumeParser(tesseract_cmd=tesseract_cmd)
+
+
+def _parse_in_worker(file_path: str) -> Dict:
+    """
+    Parse a resume file in a parse_batch worker process.
+
+    Args:
+        file_path: Path to the resume file.
+
+    Returns:
+        Dictionary with extracted text and metadata.
+    """
+    return _parse_or_error(_worker_parser, file_path)
+
+
+def _parse_or_error(parser: "ResumeParser", file_path: str) -> Dict:
+    """
+    Parse one resume file of a batch, so a file that fails doesn't discard
+    the results of the others.
+
+    Args:
+        parser: Resume parser to use.
+        file_path: Path to the resume file.
+
+    Returns:
+        Dictionary with extracted text and metadata, or {"error": message}
+        if the file could not be parsed.
+    """
+    try:
+        return parser.parse(file_path)
+    except Exception as e:
+        return {"error": str(e)}
+
 
 class ResumeParser:
     """
@@ -30,6 +77,8 @@ class ResumeParser:
         Args:
             tesseract_cmd: Path to tesseract executable (for OCR).
         """
+        self.tesseract_cmd = tesseract_cmd
+        
         # File format extractors
         self.pdf_extractor = PDFExtractor()
         self.docx_extractor = DocxExtractor()
@@ -44,12 +93,14 @@ class ResumeParser:
         self.projects_extractor = ProjectsExtractor()
         self.certifications_extractor = CertificationsExtractor()
     
-    def parse(self, file_path: str) -> Dict:
+    def parse(self, file_path: str, workers: Optional[int] = None) -> Dict:
         """
         Parse a resume file.
         
         Args:
             file_path: Path to the resume file.
+            workers: Number of worker processes to split a long PDF's pages
+                between; by default everything runs in this process.
             
         Returns:
             Dictionary with extracted text and metadata.
@@ -68,7 +119,7 @@ class ResumeParser:
         file_info = file_utils.get_file_info(file_path)
         
         # Extract text based on file type
-        text = self._extract_text(file_path)
+        text = self._extract_text(file_path, workers)
         
         # Preprocess text
         preprocessed_text = text_preprocessing.clean_text(text)
@@ -209,12 +260,80 @@ class ResumeParser:
             'certifications': certifications
         }
     
-    def _extract_text(self, file_path: str) -> str:
+    def parse_batch(self, file_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Parse many resume files in parallel.
+        
+        Parsing is CPU-bound, so the files are spread over worker processes,
+        each with its own parser. Extractors hold locks and thread-local
+        state that can't be pickled, so workers build their own instead of
+        receiving this one.
+        
+        Args:
+            file_paths: Paths to the resume files.
+            workers: Number of worker processes; defaults to the CPU count.
+                With a single worker or file, everything runs in this process.
+            
+        Returns:
+            List of parse results, one per file, in input order. A file
+            that could not be parsed gets {"error": message} instead.
+        """
+        if workers == 1 or len(file_paths) <= 1:
+            return [_parse_or_error(self, file_path) for file_path in file_paths]
+            
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.tesseract_cmd,)
+        ) as executor:
+            return list(executor.map(_parse_in_worker, file_paths))
+    
+    def parse_directory(self, directory_path: str, workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Parse every supported resume file in a directory, in parallel.
+        
+        Args:
+            directory_path: Path to the directory.
+            workers: Number of worker processes, as for parse_batch.
+            
+        Returns:
+            Dictionary mapping each file path to its parse result, sorted by
+            path, with {"error": message} for files that could not be parsed.
+            
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        file_paths = self.list_resume_files(directory_path)
+        return dict(zip(file_paths, self.parse_batch(file_paths, workers=workers)))
+    
+    def list_resume_files(self, directory_path: str) -> List[str]:
+        """
+        List the supported resume files in a directory.
+        
+        Args:
+            directory_path: Path to the directory.
+            
+        Returns:
+            Sorted list of file paths.
+            
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        if not os.path.isdir(directory_path):
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+        
+        return sorted(
+            os.path.join(directory_path, file_name)
+            for file_name in os.listdir(directory_path)
+            if file_utils.is_supported_file(file_name)
+            and os.path.isfile(os.path.join(directory_path, file_name))
+        )
+    
+    def _extract_text(self, file_path: str, workers: Optional[int] = None) -> str:
         """
         Extract text from a file based on its type.
         
         Args:
             file_path: Path to the file.
+            workers: Number of worker processes for PDF pages, as for parse.
             
         Returns:
             Extracted text.
@@ -223,7 +342,7 @@ class ResumeParser:
             ValueError: If the file type is not supported.
         """
         if file_utils.is_pdf_file(file_path):
-            return self.pdf_extractor.extract_text(file_path)
+            return self.pdf_extractor.extract_text(file_path, workers=workers)
         elif file_utils.is_docx_file(file_path):
             return self.docx_extractor.extract_text(file_path)
         elif file_utils.is_text_file(file_path):
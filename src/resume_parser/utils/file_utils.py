@@ -2,9 +2,12 @@
 File utilities for the resume parser.
 """
 
+import hashlib
 import os
 import pathlib
-from typing import Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
 
 
 def get_file_extension(file_path: str) -> str:
@@ -160,4 +163,70 @@ def list_files_by_extension(directory_path: str, extension: str) -> List[str]:
         file_path = os.path.join(directory_path, file)
         if os.path.isfile(file_path) and file.lower().endswith(f'.{extension.lower()}'):
             files.append(file_path)
-    return files 
\ No newline at end of file
+    return files 
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Hash the content of a file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        SHA-256 hex digest of the file's bytes.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """
+    Thread-safe LRU cache of values computed from files, keyed by a hash of
+    each file's content rather than its path, so the same file saved again
+    under a new name (as every upload is) still hits the cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of values kept before the least recently used is dropped.
+        """
+        self.maxsize = maxsize
+        self._values: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str, compute: Callable[[], Any], *key: Hashable) -> Any:
+        """
+        Return the cached value for a file's content, computing it on a miss.
+
+        Args:
+            file_path: Path to the file.
+            compute: Called with no arguments to compute a missing value.
+            *key: Other arguments the value depends on, such as a language.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        cache_key = (file_digest(file_path),) + key
+        with self._lock:
+            if cache_key in self._values:
+                self._values.move_to_end(cache_key)
+                return self._values[cache_key]
+
+        value = compute()
+        with self._lock:
+            self._values[cache_key] = value
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._values.clear()
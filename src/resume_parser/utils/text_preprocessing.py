@@ -3,7 +3,39 @@ Text preprocessing utilities for resume parsing.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Pattern
+
+try:
+    # RE2 matches in linear time, without backtracking on long inputs
+    import re2
+    USING_RE2 = True
+except ImportError:
+    # Fall back to the standard library engine if google-re2 is not installed
+    USING_RE2 = False
+
+try:
+    # Aho-Corasick finds every one of many fixed keywords in a single pass
+    import ahocorasick
+    USING_AHOCORASICK = True
+except ImportError:
+    # Callers fall back to their regexes if pyahocorasick is not installed
+    USING_AHOCORASICK = False
+
+# Email, LinkedIn profile, URL and phone patterns fused into one alternation
+# so extract_contact_info only has to scan the text once
+_CONTACT_PATTERN = (
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)'
+    r'|(?P<linkedin>(?:https?://(?:www\.)?)?linkedin\.com/\w+/[\w-]+)'
+    r'|(?P<url>https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+)'
+    r'|(?P<phone>(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+_CONTACT_RE = re.compile(_CONTACT_PATTERN)
+
+if USING_RE2:
+    # RE2 character classes are ASCII-only, so this is only used for ASCII text.
+    # Its \s also lacks \v and \x1c-\x1f, which are added back here (\s only
+    # appears inside character classes in the pattern).
+    _CONTACT_RE2 = re2.compile(_CONTACT_PATTERN.replace(r'\s', r'\s\x0b\x1c-\x1f'))
 
 
 def clean_text(text: str) -> str:
@@ -80,12 +112,7 @@ def extract_phone_numbers(text: str) -> List[str]:
         results.extend(matches)
     
     # Remove duplicates while preserving order
-    unique_results = []
-    for phone in results:
-        if phone not in unique_results:
-            unique_results.append(phone)
-    
-    return unique_results
+    return list(dict.fromkeys(results))
 
 
 def extract_urls(text: str) -> List[str]:
@@ -115,12 +142,43 @@ def extract_urls(text: str) -> List[str]:
         results.extend(matches)
     
     # Remove duplicates while preserving order
-    unique_results = []
-    for url in results:
-        if url not in unique_results:
-            unique_results.append(url)
+    return list(dict.fromkeys(results))
+
+
+def extract_contact_info(text: str) -> Dict[str, List[str]]:
+    """
+    Extract email addresses, phone numbers and URLs from text in a single pass.
+    
+    LinkedIn profile links are normalized to start with https:// and are
+    listed after the other URLs.
+    
+    Args:
+        text: Input text.
+        
+    Returns:
+        Dictionary with 'emails', 'phones' and 'urls' lists.
+    """
+    found = {'email': [], 'phone': [], 'url': [], 'linkedin': []}
+    seen = {kind: set() for kind in found}
+    
+    pattern = _CONTACT_RE2 if USING_RE2 and text.isascii() else _CONTACT_RE
+    for match in pattern.finditer(text):
+        # Dispatch on the alternative that matched
+        kind = match.lastgroup
+        value = match.group(kind).strip()
+        if kind == 'linkedin' and not value.startswith('http'):
+            value = f"https://{value}"
+        if value not in seen[kind]:
+            seen[kind].add(value)
+            found[kind].append(value)
+    
+    urls = found['url'] + [url for url in found['linkedin'] if url not in seen['url']]
     
-    return unique_results
+    return {
+        'emails': found['email'],
+        'phones': found['phone'],
+        'urls': urls
+    }
 
 
 def split_into_sentences(text: str) -> List[str]:
@@ -186,4 +244,47 @@ def remove_urls(text: str) -> str:
     for pattern in patterns:
         text = re.sub(pattern, '', text)
     
-    return text 
\ No newline at end of file
+    return text 
+
+
+def combine_patterns(patterns: List[str], flags: int = 0) -> Pattern:
+    """
+    Combine a family of patterns into a single regex used with ``match``.
+
+    Each pattern is wrapped in a named group ``g<i>`` behind a lazy ``.*?``,
+    so the first pattern in the list that matches anywhere in the text wins,
+    just as searching the patterns one after another would. The winning
+    pattern is ``match.lastgroup`` and its own groups start right after it,
+    at ``match.lastindex + 1``.
+
+    Args:
+        patterns: Patterns to combine, in priority order.
+        flags: Flags to compile the combined pattern with.
+
+    Returns:
+        Compiled combined pattern.
+    """
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        # Scope a leading inline flag to its own pattern
+        if pattern.startswith("(?i)"):
+            pattern = f"(?i:{pattern[4:]})"
+        alternatives.append(f"(?s:.*?)(?P<g{i}>{pattern})")
+    return re.compile("|".join(alternatives), flags)
+
+
+def build_keyword_automaton(keywords: List[str]) -> "ahocorasick.Automaton":
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+
+    Args:
+        keywords: Keywords to add, in priority order.
+
+    Returns:
+        Automaton whose values are (index in keywords, keyword length) tuples.
+    """
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(keywords):
+        automaton.add_word(keyword.lower(), (index, len(keyword)))
+    automaton.make_automaton()
+    return automaton
@@ -0,0 +1,64 @@
+"""
+Unit tests for the education extractor.
+"""
+
+import unittest
+
+from resume_parser.extractors import education_extractor
+from resume_parser.extractors.education_extractor import EducationExtractor
+
+
+class TestEducationExtractor(unittest.TestCase):
+    """Test education extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.extractor = EducationExtractor()
+
+    def test_degree_with_field(self):
+        """Test extracting a "B.S in <field>" degree."""
+        entries = self.extractor.extract_education("B.S in Physics, Stanford University, 2015 - 2019")
+        
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["degree"], "B.S in Physics")
+        self.assertEqual(entries[0]["institution"], "Stanford University")
+        self.assertEqual(entries[0]["dates"], ["2015 - 2019"])
+
+    def test_school_and_college_rows(self):
+        """Test extracting degrees from both school-level and college rows."""
+        entries = self.extractor.extract_education(
+            "HSC, Maharashtra State Board, 2016, 89%\n\nM.S. in Data Science, Columbia University, 2019 - 2021"
+        )
+        
+        self.assertEqual([entry["degree"] for entry in entries], ["HSC", "M.S. in Data Science"])
+        self.assertEqual(entries[1]["institution"], "Columbia University")
+
+    def test_cache_shared_by_extractors(self):
+        """Test that results are cached by text alone, not per extractor."""
+        EducationExtractor.clear_cache()
+        text = "B.S in Physics, Stanford University, 2015 - 2019"
+        first = EducationExtractor().extract_education(text)
+        second = EducationExtractor().extract_education(text)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(education_extractor._extract_education_cached.cache_info().hits, 1)
+
+    def test_text_without_education_signal(self):
+        """Test that text with no degree or institution yields no entries."""
+        entries = self.extractor.extract_education("Built a web app in Python\nLed a team of four")
+        
+        self.assertEqual(entries, [])
+
+    def test_long_input(self):
+        """Test long inputs that only almost match the degree and institution patterns."""
+        self.assertEqual(self.extractor.extract_education("a" * 10000), [])
+
+        entries = self.extractor.extract_education("a" * 10000 + " University")
+        self.assertEqual(entries[0]["institution"], "a" * 10000 + " University")
+
+        entries = self.extractor.extract_education("B.S in " + "a " * 5000)
+        self.assertEqual(entries[0]["degree"], "B.S in a")
+
+
+if __name__ == "__main__":
+    unittest.main()
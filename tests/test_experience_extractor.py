@@ -0,0 +1,61 @@
+"""
+Unit tests for the experience extractor.
+"""
+
+import gc
+import unittest
+import weakref
+
+from resume_parser.extractors.experience_extractor import ExperienceExtractor
+
+
+class TestExperienceExtractor(unittest.TestCase):
+    """Test experience extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.extractor = ExperienceExtractor()
+
+    def test_bullet_responsibilities(self):
+        """Test extracting bulleted responsibilities."""
+        entries = self.extractor.extract_experience(
+            "Data Engineer\nFoo Corp., 2019 - 2021\n- Built pipelines\n- Cut costs"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["date_range"], "2019 - 2021")
+        self.assertEqual(entries[0]["responsibilities"], ["Built pipelines", "Cut costs"])
+
+    def test_cached_results_are_copies(self):
+        """Test that modifying a result does not change later results."""
+        text = "Data Engineer\nFoo Corp., 2019 - 2021\n- Built pipelines\n- Cut costs"
+        entries = self.extractor.extract_experience(text)
+        entries[0]["responsibilities"].append("Added later")
+        entries[0]["company"] = "Changed"
+
+        entries = self.extractor.extract_experience(text)
+        self.assertEqual(entries[0]["responsibilities"], ["Built pipelines", "Cut costs"])
+        self.assertNotEqual(entries[0]["company"], "Changed")
+
+    def test_cache_does_not_keep_extractors(self):
+        """Test that cached results don't keep their extractor alive."""
+        extractor = ExperienceExtractor()
+        extractor.extract_experience("Data Engineer\nFoo Corp., 2019 - 2021\n- Built pipelines")
+        reference = weakref.ref(extractor)
+        
+        del extractor
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_many_bullets(self):
+        """Test that every bullet of a long entry is found."""
+        text = "Data Engineer\nFoo Corp.\n" + "".join(f"- Task {i}\n" for i in range(20000))
+
+        responsibilities = self.extractor._extract_responsibilities(text)
+
+        self.assertEqual(len(responsibilities), 20000)
+        self.assertEqual(responsibilities[-1], "Task 19999")
+
+
+if __name__ == "__main__":
+    unittest.main()
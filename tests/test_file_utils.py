@@ -93,6 +93,32 @@ class TestFileUtils(unittest.TestCase):
         xyz_files = file_utils.list_files_by_extension(self.temp_path, "xyz")
         self.assertEqual(len(xyz_files), 1)
 
+    def test_content_cache(self):
+        """Test that cached values are found by content, not path."""
+        cache = file_utils.ContentCache(maxsize=2)
+        with open(self.txt_file, "w") as f:
+            f.write("resume")
+        copy_file = os.path.join(self.temp_path, "copy.txt")
+        with open(copy_file, "w") as f:
+            f.write("resume")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(cache.get(self.txt_file, compute), 1)
+        self.assertEqual(cache.get(copy_file, compute), 1)
+        self.assertEqual(cache.get(copy_file, compute, "fra"), 2)
+
+        # Changing the content misses the cache
+        with open(copy_file, "w") as f:
+            f.write("changed")
+        self.assertEqual(cache.get(copy_file, compute), 3)
+
+        # Only the most recently used values are kept
+        self.assertEqual(cache.get(self.txt_file, compute), 4)
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
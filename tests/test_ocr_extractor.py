@@ -0,0 +1,134 @@
+"""
+Unit tests for the OCR extractor and image preparation.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from resume_parser.extractors import ocr_extractor
+from resume_parser.extractors.ocr_extractor import OCRExtractor, _otsu_threshold, _prepare_image
+
+
+class TestPrepareImage(unittest.TestCase):
+    """Test preparing images for OCR."""
+
+    def test_otsu_threshold(self):
+        """Test that the threshold separates dark and light pixels."""
+        histogram = [0] * 256
+        histogram[30] = 100
+        histogram[220] = 900
+        
+        threshold = _otsu_threshold(histogram)
+        self.assertGreaterEqual(threshold, 30)
+        self.assertLess(threshold, 220)
+
+    def test_binarized_and_downscaled(self):
+        """Test that wide color images become narrower black and white images."""
+        image = Image.new("RGB", (5000, 1000), (230, 230, 220))
+        image.paste((40, 40, 40), (100, 100, 900, 300))
+        
+        prepared = _prepare_image(image)
+        self.assertEqual(prepared.mode, "L")
+        self.assertEqual(prepared.size, (2500, 500))
+        self.assertEqual(prepared.getpixel((0, 0)), 255)
+        self.assertEqual(prepared.getpixel((250, 100)), 0)
+
+    def test_size_kept_without_max_width(self):
+        """Test that coordinates are preserved when no width limit is given."""
+        image = Image.new("RGB", (5000, 1000), "white")
+        self.assertEqual(_prepare_image(image, max_width=None).size, (5000, 1000))
+
+    def test_transparent_background_is_white(self):
+        """Test that transparent pixels do not turn black."""
+        image = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
+        self.assertEqual(_prepare_image(image).getpixel((5, 5)), 255)
+
+
+class TestTesserocrExtractor(unittest.TestCase):
+    """Test OCR through a loaded tesserocr API, with tesserocr mocked."""
+
+    def setUp(self):
+        """Set up test images and a mocked tesserocr module."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.image_paths = []
+        for shade in (0, 128, 255):
+            image_path = os.path.join(self.temp_dir.name, f"resume_{shade}.png")
+            Image.new("L", (20, 20), shade).save(image_path)
+            self.image_paths.append(image_path)
+
+        self.tesserocr = mock.Mock()
+        self.tesserocr.PyTessBaseAPI.return_value.GetUTF8Text.return_value = " John Doe\n"
+        patches = [
+            mock.patch.object(ocr_extractor, "tesserocr", self.tesserocr, create=True),
+            mock.patch.object(ocr_extractor, "USING_TESSEROCR", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        OCRExtractor.clear_cache()
+
+    def tearDown(self):
+        """Clean up test files."""
+        OCRExtractor.clear_cache()
+        self.temp_dir.cleanup()
+
+    def test_api_reused(self):
+        """Test that one API per language reads every image."""
+        extractor = OCRExtractor()
+        self.assertEqual(extractor.extract_text(self.image_paths[0]), "John Doe")
+        extractor.extract_text(self.image_paths[1])
+        extractor.extract_text(self.image_paths[1], lang="fra")
+
+        self.assertEqual(
+            self.tesserocr.PyTessBaseAPI.call_args_list,
+            [mock.call(lang="eng"), mock.call(lang="fra")],
+        )
+        self.assertEqual(self.tesserocr.PyTessBaseAPI.return_value.SetImage.call_count, 3)
+
+    def test_extract_text_batch(self):
+        """Test that a batch is read in order through a single API."""
+        extractor = OCRExtractor()
+        self.assertEqual(extractor.extract_text_batch(self.image_paths), ["John Doe"] * 3)
+        self.tesserocr.PyTessBaseAPI.assert_called_once_with(lang="eng")
+
+    def test_close(self):
+        """Test that closing ends the loaded APIs and a later read loads a new one."""
+        extractor = OCRExtractor()
+        extractor.extract_text(self.image_paths[0])
+        extractor.close()
+
+        self.tesserocr.PyTessBaseAPI.return_value.End.assert_called_once_with()
+        extractor.extract_text(self.image_paths[1])
+        self.assertEqual(self.tesserocr.PyTessBaseAPI.call_count, 2)
+
+    def test_context_manager(self):
+        """Test that leaving the with block closes the extractor."""
+        with OCRExtractor() as extractor:
+            extractor.extract_text(self.image_paths[0])
+        self.tesserocr.PyTessBaseAPI.return_value.End.assert_called_once_with()
+
+    def test_tesseract_cmd_uses_pytesseract(self):
+        """Test that asking for a specific executable skips tesserocr."""
+        with mock.patch.object(ocr_extractor.pytesseract, "image_to_string", return_value="Jane Roe") as image_to_string, \
+                mock.patch.object(ocr_extractor.pytesseract.pytesseract, "tesseract_cmd", "tesseract"):
+            extractor = OCRExtractor(tesseract_cmd="/usr/bin/tesseract")
+            self.assertEqual(extractor.extract_text(self.image_paths[0]), "Jane Roe")
+
+        image_to_string.assert_called_once()
+        self.tesserocr.PyTessBaseAPI.assert_not_called()
+
+    def test_unreadable_file(self):
+        """Test that a path that can't be read raises ValueError."""
+        directory_path = os.path.join(self.temp_dir.name, "folder.png")
+        os.mkdir(directory_path)
+
+        with self.assertRaises(ValueError):
+            OCRExtractor().extract_text(directory_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the PDF extractor.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from resume_parser.extractors import pdf_extractor
+from resume_parser.extractors.pdf_extractor import PDFExtractor
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    from PyPDF2 import PdfWriter
+
+
+class TestPDFExtractor(unittest.TestCase):
+    """Test PDF text extraction."""
+
+    def setUp(self):
+        """Set up a PDF long enough to be split between workers."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.temp_dir.name, "long_resume.pdf")
+        self.num_pages = pdf_extractor._PARALLEL_MIN_PAGES + 2
+        writer = PdfWriter()
+        for _ in range(self.num_pages):
+            writer.add_blank_page(width=612, height=792)
+        with open(self.pdf_path, "wb") as f:
+            writer.write(f)
+
+        PDFExtractor.clear_cache()
+        self.extractor = PDFExtractor()
+
+    def tearDown(self):
+        """Clean up test files."""
+        self.temp_dir.cleanup()
+
+    def test_no_worker_processes_by_default(self):
+        """Test that pages are read in this process unless workers are asked for."""
+        with mock.patch.object(pdf_extractor, "ProcessPoolExecutor") as executor:
+            self.assertEqual(self.extractor.extract_text(self.pdf_path), "")
+            self.assertEqual(self.extractor.extract(self.pdf_path)["metadata"]["pages"], self.num_pages)
+
+        executor.assert_not_called()
+
+    def test_cache_shared_by_path_and_instance(self):
+        """Test that a copy of a file read by another extractor hits the cache."""
+        copy_path = os.path.join(self.temp_dir.name, "upload.pdf")
+        shutil.copyfile(self.pdf_path, copy_path)
+        self.extractor.extract_text(self.pdf_path)
+
+        with mock.patch.object(PDFExtractor, "_extract_text_uncached") as uncached:
+            self.assertEqual(PDFExtractor().extract_text(copy_path), "")
+
+        uncached.assert_not_called()
+
+    def test_unreadable_file(self):
+        """Test that a path that can't be read raises the documented error."""
+        directory_path = os.path.join(self.temp_dir.name, "folder.pdf")
+        os.mkdir(directory_path)
+
+        with self.assertRaisesRegex(Exception, "^Error reading PDF: ") as context:
+            self.extractor.extract_text(directory_path)
+        self.assertNotIsInstance(context.exception, OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()
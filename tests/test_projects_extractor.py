@@ -0,0 +1,62 @@
+"""
+Unit tests for the projects extractor.
+"""
+
+import unittest
+
+from resume_parser.extractors.projects_extractor import ProjectsExtractor
+
+
+class TestProjectsExtractor(unittest.TestCase):
+    """Test project extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.extractor = ProjectsExtractor()
+
+    def test_extract_date_range(self):
+        """Test extracting project dates in pattern priority order."""
+        self.assertEqual(self.extractor._extract_date_range("Chat App 2019 Jan 2020 - Mar 2021"), "Jan 2020 - Mar 2021")
+        self.assertEqual(self.extractor._extract_date_range("Chat App, 2021"), "2021")
+        self.assertIsNone(self.extractor._extract_date_range("Chat App built with React"))
+
+    def test_extract_projects(self):
+        """Test extracting a bulleted project."""
+        projects = self.extractor.extract_projects(
+            "Resume Parser: parses resumes\nbuilt with Python\n- Parsed PDFs\n- Found skills"
+        )
+
+        self.assertEqual(len(projects), 1)
+        self.assertEqual(projects[0]["name"], "Resume Parser")
+        self.assertEqual(projects[0]["description"], ["Parsed PDFs", "Found skills"])
+
+    def test_many_bullets(self):
+        """Test that every bullet of a long description is found."""
+        text = "Chat App\n" + "".join(f"- Task {i}\n" for i in range(20000))
+
+        description = self.extractor._extract_description(text)
+
+        self.assertEqual(len(description), 20000)
+        self.assertEqual(description[-1], "Task 19999")
+
+    def test_extract_technologies(self):
+        """Test extracting technologies listed after a keyword."""
+        self.assertEqual(
+            self.extractor._extract_technologies("Chat App\nTech Stack: React; Node, AWS\nReal-time chat"),
+            ["React", "Node", "AWS"]
+        )
+
+    def test_long_adversarial_lines(self):
+        """Test long lines that only almost match the technology and date patterns."""
+        texts = [
+            "using " + "a," * 100000 + "!",
+            "\tin\tabc!" * 50000,
+            " Jan 2019" + " " * 100000 + "x",
+        ]
+
+        self.assertEqual([self.extractor._extract_technologies(text) for text in texts], [[], [], []])
+        self.assertEqual([self.extractor._extract_date_range(text) for text in texts], [None, None, "2019"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -166,6 +166,38 @@ Amazon Web Services
         # Check certifications
         self.assertTrue(len(result['certifications']) > 0)
 
+    def test_parse_directory(self):
+        """Test parsing every resume in a directory with worker processes."""
+        # A second resume, and a file that isn't one
+        second_resume_txt = os.path.join(self.temp_path, "second_resume.txt")
+        with open(second_resume_txt, "w") as f:
+            f.write(self._generate_sample_resume().replace("John Doe", "Jane Roe"))
+        with open(os.path.join(self.temp_path, "notes.md"), "w") as f:
+            f.write("Not a resume")
+
+        results = self.parser.parse_directory(self.temp_path, workers=2)
+
+        self.assertEqual(list(results), [self.sample_resume_txt, second_resume_txt])
+        # File access times differ between parses, so compare extracted details
+        expected = self.parser.parse(self.sample_resume_txt)
+        self.assertEqual(results[self.sample_resume_txt]['experience'], expected['experience'])
+        self.assertEqual(results[self.sample_resume_txt]['skills'], expected['skills'])
+        self.assertIn("Jane Roe", results[second_resume_txt]['raw_text'])
+
+    def test_parse_directory_with_corrupt_file(self):
+        """Test that a file that fails to parse doesn't lose the other results."""
+        corrupt_pdf = os.path.join(self.temp_path, "corrupt_resume.pdf")
+        with open(corrupt_pdf, "wb") as f:
+            f.write(b"not a PDF")
+
+        for workers in (1, 2):
+            results = self.parser.parse_directory(self.temp_path, workers=workers)
+
+            self.assertEqual(list(results), [corrupt_pdf, self.sample_resume_txt])
+            self.assertEqual(list(results[corrupt_pdf]), ['error'])
+            self.assertIn("Error reading PDF", results[corrupt_pdf]['error'])
+            self.assertIn("John Doe", results[self.sample_resume_txt]['raw_text'])
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Unit tests for the section extractor.
+"""
+
+import gc
+import unittest
+import weakref
+
+from resume_parser.extractors.section_extractor import USING_AHOCORASICK, SectionExtractor
+
+
+class TestSectionExtractor(unittest.TestCase):
+    """Test section identification."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.extractor = SectionExtractor()
+
+    def test_identify_section_title(self):
+        """Test identifying section titles, in SECTION_TITLES order."""
+        self.assertEqual(self.extractor._identify_section_title("WORK EXPERIENCE:"), "experience")
+        self.assertEqual(self.extractor._identify_section_title("  Education  "), "education")
+        # Summary is listed under both header and profile; header comes first
+        self.assertEqual(self.extractor._identify_section_title("Summary"), "header")
+        self.assertIsNone(self.extractor._identify_section_title("Built a parser in Python"))
+
+    def test_title_cache_does_not_keep_extractors(self):
+        """Test that cached section titles don't keep their extractor alive."""
+        extractor = SectionExtractor()
+        extractor._identify_section_title("Projects")
+        reference = weakref.ref(extractor)
+        
+        del extractor
+        gc.collect()
+        self.assertIsNone(reference())
+
+    @unittest.skipUnless(USING_AHOCORASICK, "pyahocorasick is not installed")
+    def test_title_candidate_lines(self):
+        """Test that only lines with a section keyword are title candidates."""
+        text = "John Doe\nWORK-EXPERIENCE\nBuilt a parser\nSkills:"
+        candidates = self.extractor._find_title_candidate_lines(text, text.split("\n"))
+
+        self.assertEqual(candidates, {1, 3})
+
+    def test_extract_sections(self):
+        """Test splitting a resume into sections."""
+        sections = self.extractor.extract_sections(
+            "John Doe\n\nSKILLS\nPython, SQL\n\nEDUCATION\nB.Tech, XYZ University"
+        )
+
+        self.assertEqual(sections["skills"], "Python, SQL")
+        self.assertEqual(sections["education"], "B.Tech, XYZ University")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -118,6 +118,31 @@ class TestTextPreprocessing(unittest.TestCase):
             []
         )
 
+    def test_extract_contact_info(self):
+        """Test extracting contact information in a single pass."""
+        contacts = text_preprocessing.extract_contact_info(
+            "jane@example.com | (123) 456-7890 | https://janesmith.com\n"
+            "linkedin.com/in/janesmith | jane@example.com"
+        )
+        self.assertEqual(contacts["emails"], ["jane@example.com"])
+        self.assertEqual(contacts["phones"], ["(123) 456-7890"])
+        self.assertEqual(
+            contacts["urls"],
+            ["https://janesmith.com", "https://linkedin.com/in/janesmith"]
+        )
+        
+        # Test that a LinkedIn profile URL is not cut off at the host
+        self.assertEqual(
+            text_preprocessing.extract_contact_info("https://linkedin.com/in/user")["urls"],
+            ["https://linkedin.com/in/user"]
+        )
+        
+        # Test no contact information
+        self.assertEqual(
+            text_preprocessing.extract_contact_info("No contact here"),
+            {"emails": [], "phones": [], "urls": []}
+        )
+
     def test_split_into_sentences(self):
         """Test splitting text into sentences."""
         # Test basic splitting
@@ -168,6 +193,16 @@ class TestTextPreprocessing(unittest.TestCase):
             "No URL here"
         )
 
+    @unittest.skipUnless(text_preprocessing.USING_AHOCORASICK, "pyahocorasick is not installed")
+    def test_build_keyword_automaton(self):
+        """Test that keyword matches report their index and length."""
+        automaton = text_preprocessing.build_keyword_automaton(["MIT", "Stanford"])
+        
+        self.assertEqual(
+            list(automaton.iter("stanford and mit")),
+            [(7, (1, 8)), (15, (0, 3))]
+        )
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file